@@ -9,10 +9,57 @@ from __future__ import annotations
 import logging
 import time
 import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, Protocol
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+)
 
 from vision_cortex.memory.memory_registry import MemoryRegistry
+from vision_cortex.validators.safety import enforce_governance
+
+# Set by AgentChain: log events are collected here instead of being
+# published and persisted per stage.
+_CHAIN_EVENTS: ContextVar[Optional[List[Dict[str, Any]]]] = ContextVar(
+    "vision_cortex_chain_events", default=None
+)
+
+# (method name, arguments after the context) for each log_event,
+# publish_event and persist_memory call; active inside record_side_effects().
+SideEffect = Tuple[str, Tuple[Any, ...]]
+_SIDE_EFFECTS: ContextVar[Optional[List[SideEffect]]] = ContextVar(
+    "vision_cortex_side_effects", default=None
+)
+
+
+@contextmanager
+def record_side_effects() -> Iterator[List[SideEffect]]:
+    """Collect the agent side effects issued while the block is active.
+
+    The calls still take effect; the list lets a caller (the run cache) issue
+    them again for another context.
+    """
+    effects: List[SideEffect] = []
+    token = _SIDE_EFFECTS.set(effects)
+    try:
+        yield effects
+    finally:
+        _SIDE_EFFECTS.reset(token)
+
+
+def _record(method: str, *args: Any) -> None:
+    effects = _SIDE_EFFECTS.get()
+    if effects is not None:
+        effects.append((method, args))
 
 
 class MessageBus(Protocol):
@@ -21,7 +68,7 @@ class MessageBus(Protocol):
     def subscribe(self, topic: str, handler: Any) -> None: ...
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentContext:
     session_id: str
     task_id: str
@@ -29,6 +76,16 @@ class AgentContext:
     confidence: float = 0.0
     tags: Dict[str, Any] = field(default_factory=dict)
 
+    def as_dict(self) -> Dict[str, Any]:
+        """Shallow field mapping for event payloads (slots leave no __dict__)."""
+        return {
+            "session_id": self.session_id,
+            "task_id": self.task_id,
+            "governance_level": self.governance_level,
+            "confidence": self.confidence,
+            "tags": self.tags,
+        }
+
 
 @dataclass
 class BaseAgent:
@@ -47,6 +104,7 @@ class BaseAgent:
         context: AgentContext,
         extra: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
+        _record("log_event", message, extra)
         payload = {
             "timestamp": time.time(),
             "event_id": str(uuid.uuid4()),
@@ -54,12 +112,16 @@ class BaseAgent:
             "role": self.role,
             "governance_level": self.governance_level,
             "message": message,
-            "context": context.__dict__,
+            "context": context.as_dict(),
             "extra": extra or {},
         }
         self.logger.info(
-            "%s | ctx=%s | extra=%s", message, context.__dict__, extra or {}
+            "%s | ctx=%s | extra=%s", message, payload["context"], payload["extra"]
         )
+        chain_events = _CHAIN_EVENTS.get()
+        if chain_events is not None:
+            chain_events.append(payload)
+            return payload
         self.bus.publish("logs", payload)
         if self.memory:
             self.memory.persist_event(
@@ -79,17 +141,19 @@ class BaseAgent:
     def publish_event(
         self, topic: str, context: AgentContext, content: Dict[str, Any]
     ) -> None:
+        _record("publish_event", topic, content)
         event = {
             "timestamp": time.time(),
             "event_id": str(uuid.uuid4()),
             "from": self.name,
             "role": self.role,
-            "context": context.__dict__,
+            "context": context.as_dict(),
             "content": content,
         }
         self.bus.publish(topic, event)
 
     def persist_memory(self, record: Dict[str, Any]) -> None:
+        _record("persist_memory", record)
         if self.memory:
             self.memory.persist_event(record)
         else:
@@ -102,3 +166,82 @@ class BaseAgent:
         self, context: AgentContext, payload: Dict[str, Any]
     ) -> Dict[str, Any]:
         raise NotImplementedError("Agents must implement run_task()")
+
+
+# (stage name, agent, builds the stage payload from earlier stage results)
+ChainStage = Tuple[str, BaseAgent, Callable[[Dict[str, Any]], Dict[str, Any]]]
+StageRunner = Callable[[BaseAgent, AgentContext, Dict[str, Any]], Dict[str, Any]]
+
+
+def _run_stage(
+    agent: BaseAgent, context: AgentContext, payload: Dict[str, Any]
+) -> Dict[str, Any]:
+    return agent.run_task(context, payload)
+
+
+class AgentChain:
+    """Run dependent agent stages in one call over a shared context.
+
+    Governance is resolved once at the chain boundary and per-stage log
+    events are coalesced into a single ``logs`` publish and memory write.
+    Stage topic events (``publish_event``) are still emitted per stage.
+    """
+
+    def __init__(
+        self,
+        bus: MessageBus,
+        memory: Optional[MemoryRegistry] = None,
+        name: str = "agent_chain",
+        runner: StageRunner = _run_stage,
+    ) -> None:
+        self.bus = bus
+        self.memory = memory
+        self.name = name
+        self.runner = runner
+
+    def run(
+        self, context: AgentContext, stages: Sequence[ChainStage]
+    ) -> Dict[str, Any]:
+        context.governance_level = enforce_governance(context.governance_level)
+        results: Dict[str, Any] = {}
+        events: List[Dict[str, Any]] = []
+        token = _CHAIN_EVENTS.set(events)
+        try:
+            for stage, agent, build_payload in stages:
+                results[stage] = self.runner(agent, context, build_payload(results))
+        finally:
+            _CHAIN_EVENTS.reset(token)
+        if events:
+            self._emit(context, [stage for stage, _, _ in stages], events)
+        return results
+
+    def _emit(
+        self,
+        context: AgentContext,
+        stages: List[str],
+        events: List[Dict[str, Any]],
+    ) -> None:
+        payload = {
+            "timestamp": time.time(),
+            "event_id": str(uuid.uuid4()),
+            "agent": self.name,
+            "role": "chain",
+            "governance_level": context.governance_level,
+            "message": f"Chain completed: {' -> '.join(stages)}",
+            "context": context.as_dict(),
+            "extra": {"events": events},
+        }
+        self.bus.publish("logs", payload)
+        if self.memory:
+            self.memory.persist_event(
+                {
+                    "type": "agent_status",
+                    "agent": self.name,
+                    "role": "chain",
+                    "content": payload,
+                    "confidence": context.confidence,
+                    "governance_level": context.governance_level,
+                    "session_hash": context.session_id,
+                    "created_at": payload["timestamp"],
+                }
+            )
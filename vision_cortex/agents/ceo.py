@@ -27,7 +27,7 @@ class CEOAgent(BaseAgent):
                 rationale=rationale,
                 governance_level=self.governance_level,
             )
-            prioritized.append(action.__dict__)
+            prioritized.append(action.as_dict())
         self.log_event("Prioritized actions", context, {"count": len(prioritized)})
         self.publish_event("priorities", context, {"count": len(prioritized)})
         self.persist_memory(
@@ -33,7 +33,7 @@ class CrawlerAgent(BaseAgent):
                 tags=["crawler", hostname],
                 confidence=min(confidence, 0.95),
             )
-            observations.append(obs.__dict__)
+            observations.append(obs.as_dict())
             self.log_event(
                 "Collected observation",
                 context,
@@ -28,7 +28,7 @@ class PredictorAgent(BaseAgent):
                 tag="EMERGING" if len(docs) < 3 else "REAL-TODAY",
                 signals=[d.get("title", "") for d in docs][:5],
             )
-            predictions.append(pred.__dict__)
+            predictions.append(pred.as_dict())
             self.log_event(
                 "Generated prediction",
                 context,
@@ -0,0 +1,210 @@
+"""Bounded LRU cache around ``BaseAgent.run_task``.
+
+Agents in Vision Cortex are deterministic over their payload, so repeated
+builds and debate cycles over an identical seed can reuse the previous
+result instead of re-executing the agent. Entries are keyed on the agent
+name plus a blake2b digest of the canonically serialised payload, ignoring
+fields that only record when or for which session an input was produced.
+Results that contain such fields are not cached, so a hit never hands one
+session another session's ids or timestamps. A hit replays the agent's logs, events and memory writes for the new
+session, so every session is still persisted as if the agent had run.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from hashlib import blake2b
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from vision_cortex.agents.base_agent import (
+    AgentContext,
+    BaseAgent,
+    SideEffect,
+    record_side_effects,
+)
+
+try:
+    import orjson
+
+    def _canonical(payload: Any) -> bytes:
+        return orjson.dumps(
+            payload,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            default=str,
+        )
+
+except ImportError:
+
+    def _canonical(payload: Any) -> bytes:
+        return json.dumps(
+            payload, sort_keys=True, separators=(",", ":"), default=str
+        ).encode()
+
+
+# id(value) -> (value, encoded bytes); active inside shared_encoding(). Holding
+# the value keeps its id stable for as long as the memo lives.
+_ENCODED: ContextVar[Optional[Dict[int, Tuple[Any, bytes]]]] = ContextVar(
+    "vision_cortex_run_cache_encoded", default=None
+)
+
+RUN_CACHE_SIZE = 512
+# Governance levels whose runs must always execute the agent.
+UNCACHED_GOVERNANCE = frozenset({"CRITICAL"})
+# Per-run stamps (crawl times, session and event ids) left out of cache keys,
+# at any depth. Results that contain them are not cached.
+VOLATILE_KEYS = frozenset(
+    {"timestamp", "created_at", "session_id", "session", "task_id", "event_id"}
+)
+# Persisted record fields taken from the replaying run's context.
+_CONTEXT_FIELDS = (
+    ("session_hash", "session_id"),
+    ("task_id", "task_id"),
+    ("confidence", "confidence"),
+)
+
+CacheEntry = Tuple[Dict[str, Any], List[SideEffect]]
+
+
+def _stable(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _stable(v) for k, v in value.items() if k not in VOLATILE_KEYS}
+    if isinstance(value, (list, tuple)):
+        return [_stable(v) for v in value]
+    return value
+
+
+def _has_volatile(value: Any) -> bool:
+    if isinstance(value, dict):
+        return any(k in VOLATILE_KEYS or _has_volatile(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return any(_has_volatile(v) for v in value)
+    return False
+
+
+class ToolRunCache:
+    """Thread-safe ``OrderedDict`` LRU of agent results and their side effects."""
+
+    def __init__(self, maxsize: int = RUN_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[bytes, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(agent: BaseAgent, payload: Dict[str, Any]) -> Optional[bytes]:
+        digest = blake2b(agent.name.encode(), digest_size=16)
+        memo = _ENCODED.get()
+        try:
+            for name in sorted(payload):
+                if name in VOLATILE_KEYS:
+                    continue
+                value = payload[name]
+                if memo is None:
+                    body = _canonical(_stable(value))
+                else:
+                    cached = memo.get(id(value))
+                    if cached is None or cached[0] is not value:
+                        body = _canonical(_stable(value))
+                        cached = memo[id(value)] = (value, body)
+                    body = cached[1]
+                digest.update(b"\0%s\0%d:" % (name.encode(), len(body)))
+                digest.update(body)
+        except (TypeError, ValueError):
+            return None
+        return digest.digest()
+
+    def get(self, key: bytes) -> Optional[CacheEntry]:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key: bytes, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+RUN_CACHE = ToolRunCache()
+
+
+@contextmanager
+def shared_encoding() -> Iterator[None]:
+    """Encode each payload value at most once while the block is active.
+
+    Stage outputs that feed several downstream agents (organized, vision,
+    strategy, ...) are then serialised once for cache keying instead of once
+    per consumer. Values must not be mutated while the block is active.
+    """
+    token = _ENCODED.set({})
+    try:
+        yield
+    finally:
+        _ENCODED.reset(token)
+
+
+def cached_run(
+    agent: BaseAgent,
+    ctx: AgentContext,
+    payload: Dict[str, Any],
+    cache: ToolRunCache = RUN_CACHE,
+) -> Dict[str, Any]:
+    """Return ``agent.run_task(ctx, payload)``, reusing a prior identical run.
+
+    Runs under CRITICAL governance always execute, and results carrying
+    per-run stamps are never stored. A cache hit skips the work
+    but replays the agent's log events, bus events and memory writes under
+    ``ctx``. Callers always get their own copy of the result.
+    """
+    if ctx.governance_level in UNCACHED_GOVERNANCE:
+        return agent.run_task(ctx, payload)
+    key = cache.key(agent, payload)
+    if key is None:
+        return agent.run_task(ctx, payload)
+    entry = cache.get(key)
+    if entry is None:
+        with record_side_effects() as effects:
+            result = agent.run_task(ctx, payload)
+        if not _has_volatile(result):
+            cache.put(key, copy.deepcopy((result, effects)))
+        return result
+    result, effects = copy.deepcopy(entry)
+    _replay(agent, ctx, effects)
+    return result
+
+
+def _replay(agent: BaseAgent, ctx: AgentContext, effects: List[SideEffect]) -> None:
+    for method, args in effects:
+        if method == "log_event":
+            agent.log_event(args[0], ctx, args[1])
+        elif method == "publish_event":
+            agent.publish_event(args[0], ctx, args[1])
+        elif method == "persist_memory":
+            record = args[0]
+            for field, attr in _CONTEXT_FIELDS:
+                if field in record:
+                    record[field] = getattr(ctx, attr)
+            if "created_at" in record:
+                record["created_at"] = time.time()
+            agent.persist_memory(record)
@@ -29,7 +29,7 @@ class StrategistAgent(BaseAgent):
                     ],
                     risk="medium",
                     success_metric="Signals tracked weekly",
-                ).__dict__
+                ).as_dict()
             )
             steps.append(
                 PlanStep(
@@ -41,7 +41,7 @@ class StrategistAgent(BaseAgent):
                     ],
                     risk="medium",
                     success_metric="Validated experiments >60%",
-                ).__dict__
+                ).as_dict()
             )
             steps.append(
                 PlanStep(
@@ -53,7 +53,7 @@ class StrategistAgent(BaseAgent):
                     ],
                     risk="low",
                     success_metric="Run-rate impact sustained",
-                ).__dict__
+                ).as_dict()
             )
         if scenarios:
             steps.append(
@@ -66,7 +66,7 @@ class StrategistAgent(BaseAgent):
                     ],
                     risk="high",
                     success_metric="Response time <48h",
-                ).__dict__
+                ).as_dict()
             )
         self.log_event("Generated strategy steps", context, {"count": len(steps)})
         self.publish_event("strategy", context, {"steps": len(steps)})
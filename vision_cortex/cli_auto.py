@@ -24,9 +24,9 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import sys
 import time
-import uuid
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Dict, List
 
@@ -38,10 +38,7 @@ from vision_cortex.prompts.executor import PromptExecutor
 
 # Try to import domain-specific utilities
 try:
-    from vision_cortex.prompts.domain_registry import (
-        get_domain_categories,
-        list_domain_prompts,
-    )
+    from vision_cortex.prompts.domain_registry import get_domain_categories
 
     HAS_DOMAIN = True
 except ImportError:
@@ -50,9 +47,6 @@ except ImportError:
     def get_domain_categories() -> List[str]:
         return []
 
-    def list_domain_prompts(**kwargs) -> List[Any]:
-        return []
-
 
 def print_prompt_table(prompts: List[Any]) -> None:
     """Pretty-print prompt definitions."""
@@ -131,11 +125,8 @@ def main(argv: list[str] | None = None) -> int:
 
         # Filter by category if specified
         if args.category:
-            prompts = [
-                p
-                for p in prompts
-                if args.category.lower() in (t.lower() for t in p.tags)
-            ]
+            category = args.category.lower()
+            prompts = [p for p in prompts if category in p.tags]
 
         if not prompts:
             print("No prompts found matching criteria.")
@@ -171,9 +162,12 @@ def main(argv: list[str] | None = None) -> int:
         print("Invalid JSON seed", file=sys.stderr)
         return 1
 
-    seeds: List[Dict[str, Any]] = []
-    for _ in range(args.runs):
-        seeds.append({**seed_payload, "session_id": str(uuid.uuid4())})
+    # One urandom read for all session IDs instead of a uuid4() per run
+    raw = os.urandom(16 * args.runs)
+    seeds: List[Dict[str, Any]] = [
+        {**seed_payload, "session_id": raw[i * 16 : (i + 1) * 16].hex()}
+        for i in range(args.runs)
+    ]
 
     # Run builds in parallel using ThreadPoolExecutor
     results: List[Dict[str, Any]] = []
@@ -4,50 +4,54 @@ from __future__ import annotations
 
 import logging
 import threading
-from collections import defaultdict
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Tuple
+
+Handler = Callable[[Dict[str, Any]], None]
+Middleware = Callable[[str, Dict[str, Any]], Dict[str, Any]]
 
 
 class MessageBus:
     def __init__(self, name: str = "vision_cortex") -> None:
-        self._subscribers: Dict[str, List[Callable[[Dict[str, Any]], None]]] = (
-            defaultdict(list)
-        )
+        # Copy-on-write state: writers rebind immutable snapshots under the
+        # lock, readers (publish/topics) use whatever snapshot they see.
+        self._subscribers: Dict[str, Tuple[Handler, ...]] = {}
         self._lock = threading.Lock()
         self._logger = logging.getLogger(f"vision_cortex.bus.{name}")
-        self._middlewares: List[Callable[[str, Dict[str, Any]], Dict[str, Any]]] = []
+        self._middlewares: Tuple[Middleware, ...] = ()
 
-    def add_middleware(
-        self, middleware: Callable[[str, Dict[str, Any]], Dict[str, Any]]
-    ) -> None:
+    def add_middleware(self, middleware: Middleware) -> None:
         """Register middleware that can enrich or filter payloads."""
         with self._lock:
-            self._middlewares.append(middleware)
+            self._middlewares = self._middlewares + (middleware,)
 
     def publish(self, topic: str, payload: Dict[str, Any]) -> None:
         enriched = payload
-        with self._lock:
-            middlewares = list(self._middlewares)
-            subscribers = list(self._subscribers.get(topic, []))
+        middlewares = self._middlewares
+        subscribers = self._subscribers.get(topic, ())
 
         for mw in middlewares:
             try:
                 enriched = mw(topic, enriched)
             except Exception as exc:  # middleware failure should not block publish
-                self._logger.warning("Middleware failure on topic %s: %s", topic, exc)
+                if self._logger.isEnabledFor(logging.WARNING):
+                    self._logger.warning(
+                        "Middleware failure on topic %s: %s", topic, exc
+                    )
                 continue
 
         for handler in subscribers:
             try:
                 handler(enriched)
             except Exception as exc:
-                self._logger.error("Subscriber failure on topic %s: %s", topic, exc)
+                if self._logger.isEnabledFor(logging.ERROR):
+                    self._logger.error("Subscriber failure on topic %s: %s", topic, exc)
                 continue
 
-    def subscribe(self, topic: str, handler: Callable[[Dict[str, Any]], None]) -> None:
+    def subscribe(self, topic: str, handler: Handler) -> None:
         with self._lock:
-            self._subscribers[topic].append(handler)
+            subscribers = dict(self._subscribers)
+            subscribers[topic] = subscribers.get(topic, ()) + (handler,)
+            self._subscribers = subscribers
 
     def topics(self) -> List[str]:
-        with self._lock:
-            return list(self._subscribers.keys())
+        return list(self._subscribers.keys())
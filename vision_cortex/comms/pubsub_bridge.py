@@ -45,7 +45,8 @@ class PubSubBridge:
         try:
             self.memory.persist_event(record)
         except Exception as exc:
-            self.logger.error("Failed to persist bus log: %s", exc)
+            if self.logger.isEnabledFor(logging.ERROR):
+                self.logger.error("Failed to persist bus log: %s", exc)
 
     def send_to_bus(
         self, topic: str, payload: Dict[str, Any], governance_level: str = "HIGH"
@@ -18,7 +18,8 @@ class SmartRouter:
 
     def register_agent(self, role: str, agent: Any) -> None:
         self._agents[role] = agent
-        self._logger.info("Registered agent %s", role)
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info("Registered agent %s", role)
 
     def map_intent(self, intent: str, role: str) -> None:
         self._intent_map[intent] = role
@@ -34,10 +35,12 @@ class SmartRouter:
         if not ctx:
             raise ValueError("Context is required in payload for dispatch")
         ctx.governance_level = enforce_governance(ctx.governance_level)
-        self._logger.info(
-            "Dispatching intent=%s to role=%s governance=%s",
-            intent,
-            role,
-            ctx.governance_level,
-        )
+        # Logger.isEnabledFor is cached; skip building log args when filtered
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(
+                "Dispatching intent=%s to role=%s governance=%s",
+                intent,
+                role,
+                ctx.governance_level,
+            )
         return agent.run_task(ctx, payload.get("data", {}))
@@ -35,7 +35,7 @@ class AgentRole(Enum):
     DOCUMENTOR = "documentor"
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentIdentity:
     """Immutable agent identity."""
 
@@ -43,6 +43,7 @@ class AgentIdentity:
     version: str
     governance_level: GovernanceLevel
     created_at: datetime = field(default_factory=datetime.utcnow)
+    _frozen: bool = field(default=False, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         # Enforce immutability after creation
@@ -53,7 +54,7 @@ class AgentIdentity:
         return f"{self.role.value}_v{self.version}"
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskResult:
     """Mandatory output structure for all agent tasks."""
 
@@ -71,7 +72,7 @@ class TaskResult:
             raise ValueError("Reasoning is mandatory — no silent outputs")
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentContext:
     """Context passed to agent for task execution."""
 
@@ -111,16 +112,21 @@ class AgentContract:
 
     REQUIRED_METHODS = ["run_task", "validate_input", "emit_intent"]
 
+    # Agent classes do not change after import; cache violations per class
+    _validated: Dict[type, List[str]] = {}
+
     @staticmethod
     def validate_implementation(agent_class) -> List[str]:
         """Validate that an agent class implements all required methods."""
+        cached = AgentContract._validated.get(agent_class)
+        if cached is not None:
+            return list(cached)
         violations = []
         for method in AgentContract.REQUIRED_METHODS:
-            if not hasattr(agent_class, method) or not callable(
-                getattr(agent_class, method)
-            ):
+            if not callable(getattr(agent_class, method, None)):
                 violations.append(f"Missing required method: {method}")
-        return violations
+        AgentContract._validated[agent_class] = violations
+        return list(violations)
 
     @staticmethod
     def validate_result(result: TaskResult, governance_level: GovernanceLevel) -> bool:
@@ -133,7 +139,7 @@ class AgentContract:
 
 
 # Intent Schema — Required for all agent emissions
-@dataclass
+@dataclass(slots=True)
 class IntentEmission:
     """
     Mandatory intent structure for agent outputs.
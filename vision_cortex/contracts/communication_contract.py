@@ -6,11 +6,13 @@ All agent-to-agent communication MUST go through this contract.
 Direct calls between agents are FORBIDDEN.
 """
 
-import hashlib
+import zlib
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Deque, Dict, FrozenSet, List, Optional
 
 
 class ChannelType(Enum):
@@ -33,7 +35,13 @@ class MessagePriority(Enum):
     EMERGENCY = 5  # Triggers immediate processing
 
 
-@dataclass
+# Free-list of released messages; append/pop on a deque are atomic, and
+# maxlen caps retained memory by discarding the oldest entry when full.
+MESSAGE_POOL_SIZE = 4096
+_MESSAGE_POOL: Deque["MessageSchema"] = deque(maxlen=MESSAGE_POOL_SIZE)
+
+
+@dataclass(slots=True)
 class MessageSchema:
     """
     Mandatory schema for all inter-agent messages.
@@ -53,9 +61,68 @@ class MessageSchema:
 
     def __post_init__(self):
         if not self.message_id:
-            # Generate deterministic message ID
+            # Generate deterministic 64-bit message ID (CRC32 + Adler-32);
+            # in-process IDs need no cryptographic strength.
             key = f"{self.sender_id}:{self.channel.value}:{self.timestamp.isoformat()}"
-            self.message_id = hashlib.sha256(key.encode()).hexdigest()[:16]
+            data = key.encode()
+            self.message_id = f"{zlib.crc32(data):08x}{zlib.adler32(data):08x}"
+
+    @classmethod
+    def acquire(
+        cls,
+        channel: ChannelType,
+        sender_id: str,
+        payload: Dict[str, Any],
+        message_id: str = "",
+        priority: MessagePriority = MessagePriority.NORMAL,
+        recipients: Optional[List[str]] = None,
+        requires_ack: bool = False,
+        timestamp: Optional[datetime] = None,
+        ttl_seconds: int = 3600,
+        correlation_id: Optional[str] = None,
+    ) -> "MessageSchema":
+        """Take a message from the free-list (or allocate one) and initialise it.
+
+        Handlers that do not retain the message should hand it back with
+        ``release()``; handlers that do retain it must copy what they need.
+        """
+        if timestamp is None:
+            timestamp = datetime.utcnow()
+        try:
+            msg = _MESSAGE_POOL.pop()
+        except IndexError:
+            return cls(
+                message_id=message_id,
+                channel=channel,
+                sender_id=sender_id,
+                payload=payload,
+                priority=priority,
+                recipients=recipients if recipients is not None else [],
+                requires_ack=requires_ack,
+                timestamp=timestamp,
+                ttl_seconds=ttl_seconds,
+                correlation_id=correlation_id,
+            )
+        msg.message_id = message_id
+        msg.channel = channel
+        msg.sender_id = sender_id
+        msg.payload = payload
+        msg.priority = priority
+        msg.recipients = recipients if recipients is not None else []
+        msg.requires_ack = requires_ack
+        msg.timestamp = timestamp
+        msg.ttl_seconds = ttl_seconds
+        msg.correlation_id = correlation_id
+        msg.__post_init__()
+        return msg
+
+    def release(self) -> None:
+        """Drop payload references and return this message to the free-list."""
+        self.payload = {}
+        self.recipients = []
+        self.correlation_id = None
+        if type(self) is MessageSchema:
+            _MESSAGE_POOL.append(self)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -72,7 +139,7 @@ class MessageSchema:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DebateMessage:
     """
     Specialized message for debate arena.
@@ -95,6 +162,12 @@ class DebateMessage:
             raise ValueError(f"Confidence must be 0.0-1.0, got {self.confidence}")
 
 
+@lru_cache(maxsize=1024)
+def role_of(agent_id: str) -> str:
+    """Extract the role prefix from an agent ID (e.g. ``predictor_01``)."""
+    return agent_id.split("_", 1)[0]
+
+
 class CommunicationContract:
     """
     Contract governing all inter-agent communication.
@@ -124,10 +197,12 @@ class CommunicationContract:
     }
 
     # Agents that can send to specific channels
-    CHANNEL_PERMISSIONS: Dict[str, List[str]] = {
-        "debate.arena": ["predictor", "visionary", "strategist", "validator", "ceo"],
-        "consensus.builder": ["ceo", "validator"],
-        "system.broadcast": ["ceo", "validator"],
+    CHANNEL_PERMISSIONS: Dict[str, FrozenSet[str]] = {
+        "debate.arena": frozenset(
+            {"predictor", "visionary", "strategist", "validator", "ceo"}
+        ),
+        "consensus.builder": frozenset({"ceo", "validator"}),
+        "system.broadcast": frozenset({"ceo", "validator"}),
     }
 
     @staticmethod
@@ -138,8 +213,8 @@ class CommunicationContract:
             return True
 
         # Check specific channel permissions
-        if channel in CommunicationContract.CHANNEL_PERMISSIONS:
-            allowed = CommunicationContract.CHANNEL_PERMISSIONS[channel]
+        allowed = CommunicationContract.CHANNEL_PERMISSIONS.get(channel)
+        if allowed is not None:
             return any(agent in agent_id for agent in allowed)
 
         # Default: allow output channels
@@ -162,7 +237,7 @@ class CommunicationContract:
         # Debate participants can receive debate messages
         if channel == "debate.arena":
             return agent_id in CommunicationContract.CHANNEL_PERMISSIONS.get(
-                channel, []
+                channel, frozenset()
             )
 
         # CEO and Validator can receive all agent outputs
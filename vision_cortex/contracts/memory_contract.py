@@ -7,10 +7,29 @@ Direct Firestore access is FORBIDDEN.
 """
 
 import hashlib
+import os
+import sys
+import zlib
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from .communication_contract import role_of
+
+# Non-cryptographic 64-bit doc IDs (CRC32 + Adler-32). Off by default so
+# IDs of documents already written with the SHA-256 scheme stay stable.
+MEMORY_FAST_HASH = os.environ.get("MEMORY_FAST_HASH", "0") == "1"
+
+# "v2" prefixes doc IDs with created_at in epoch microseconds so Firestore
+# inserts are sequential; "v1" keeps the hash-only IDs (see MemoryContract).
+DOC_ID_SCHEME = os.environ.get("DOC_ID_SCHEME", "v1")
+
+_NO_ROLES: FrozenSet[str] = frozenset()
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MICROSECOND = timedelta(microseconds=1)
 
 
 class MemoryType(Enum):
@@ -26,11 +45,14 @@ class MemoryType(Enum):
     AUDIT_LOG = "audit_log"
 
 
-@dataclass
+@dataclass(slots=True)
 class MemorySchema:
     """
     Mandatory schema for all memory entries.
     Enforced at write time — violations rejected.
+
+    Entries are treated as immutable once built: ``doc_id`` and
+    ``to_firestore_doc`` are computed on first use and cached.
     """
 
     session_hash: str
@@ -43,6 +65,15 @@ class MemorySchema:
     expires_at: Optional[datetime] = None
     tags: List[str] = field(default_factory=list)
     prompt_hash: Optional[str] = None
+    _type_value: str = field(default="", init=False, repr=False, compare=False)
+    _created_iso: str = field(default="", init=False, repr=False, compare=False)
+    _expires_iso: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _doc_id: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _fs_doc: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         if not 0.0 <= self.confidence <= 1.0:
@@ -51,27 +82,48 @@ class MemorySchema:
             raise ValueError("session_hash is mandatory")
         if not self.agent_id:
             raise ValueError("agent_id is mandatory")
+        # Dedupe the highly repeated identifier strings across entries
+        self.session_hash = sys.intern(self.session_hash)
+        self.agent_id = sys.intern(self.agent_id)
+        self._type_value = self.type.value
+        self._created_iso = self.created_at.isoformat()
+        if self.expires_at is not None:
+            self._expires_iso = self.expires_at.isoformat()
 
     @property
     def doc_id(self) -> str:
         """Generate deterministic document ID."""
-        key = f"{self.session_hash}:{self.type.value}:{self.created_at.isoformat()}"
-        return hashlib.sha256(key.encode()).hexdigest()[:16]
+        if self._doc_id is None:
+            key = f"{self.session_hash}:{self._type_value}:{self._created_iso}"
+            data = key.encode()
+            if DOC_ID_SCHEME == "v2":
+                created = self.created_at
+                if created.tzinfo is None:  # naive timestamps are UTC here
+                    created = created.replace(tzinfo=timezone.utc)
+                micros = (created - _EPOCH) // _ONE_MICROSECOND
+                self._doc_id = f"{micros:016x}{zlib.crc32(data):08x}"
+            elif MEMORY_FAST_HASH:
+                self._doc_id = f"{zlib.crc32(data):08x}{zlib.adler32(data):08x}"
+            else:
+                self._doc_id = hashlib.sha256(data).hexdigest()[:16]
+        return self._doc_id
 
     def to_firestore_doc(self) -> Dict[str, Any]:
-        """Convert to Firestore-compatible document."""
-        return {
-            "session_hash": self.session_hash,
-            "type": self.type.value,
-            "content": self.content,
-            "confidence": self.confidence,
-            "sources": self.sources,
-            "agent_id": self.agent_id,
-            "created_at": self.created_at.isoformat(),
-            "expires_at": self.expires_at.isoformat() if self.expires_at else None,
-            "tags": self.tags,
-            "prompt_hash": self.prompt_hash,
-        }
+        """Convert to Firestore-compatible document (cached; do not mutate)."""
+        if self._fs_doc is None:
+            self._fs_doc = {
+                "session_hash": self.session_hash,
+                "type": self._type_value,
+                "content": self.content,
+                "confidence": self.confidence,
+                "sources": self.sources,
+                "agent_id": self.agent_id,
+                "created_at": self._created_iso,
+                "expires_at": self._expires_iso,
+                "tags": self.tags,
+                "prompt_hash": self.prompt_hash,
+            }
+        return self._fs_doc
 
 
 class MemoryContract:
@@ -84,73 +136,88 @@ class MemoryContract:
     3. Cross-agent memory access requires explicit permission
     4. Conversation logs are always persisted
     5. Audit trail is immutable
+
+    Migration note: ``DOC_ID_SCHEME=v2`` switches new entries to 24-char
+    time-prefixed doc IDs. Existing v1 documents keep their IDs; readers
+    that look entries up by ID must try both schemes until backfilled.
     """
 
     COLLECTION = "mcp_memory"
 
     # Agents that can read all memory
     OMNISCIENT_AGENTS = ["ceo", "validator"]
+    _OMNI: FrozenSet[str] = frozenset(OMNISCIENT_AGENTS)
 
     # Memory types that are shared across agents
-    SHARED_TYPES = [
-        MemoryType.PREDICTION,
-        MemoryType.SIGNAL,
-        MemoryType.CONSENSUS,
-        MemoryType.DEBATE,
-    ]
+    SHARED_TYPES: FrozenSet[MemoryType] = frozenset(
+        {
+            MemoryType.PREDICTION,
+            MemoryType.SIGNAL,
+            MemoryType.CONSENSUS,
+            MemoryType.DEBATE,
+        }
+    )
+
+    # Type-specific write permissions by role
+    TYPE_PERMISSIONS: Dict[MemoryType, FrozenSet[str]] = {
+        MemoryType.INFERENCE: frozenset({"predictor", "visionary", "strategist"}),
+        MemoryType.PREDICTION: frozenset({"predictor", "visionary"}),
+        MemoryType.DEBATE: frozenset({"validator", "ceo"}),
+        MemoryType.SIGNAL: frozenset({"crawler", "ingestor", "organizer"}),
+        MemoryType.CONSENSUS: frozenset({"ceo", "validator"}),
+        MemoryType.MUTATION: frozenset({"evolver", "ceo"}),  # evolver may be added
+    }
+
+    # Types any agent may write
+    _OPEN_WRITE_TYPES: FrozenSet[MemoryType] = frozenset(
+        {MemoryType.AGENT_STATUS, MemoryType.AUDIT_LOG}
+    )
 
     @staticmethod
     def can_read(agent_id: str, entry: MemorySchema) -> bool:
         """Check if agent can read this memory entry."""
-        # Omniscient agents can read everything
-        if any(omni in agent_id for omni in MemoryContract.OMNISCIENT_AGENTS):
-            return True
-
-        # Agents can read their own memory
-        if entry.agent_id == agent_id:
-            return True
-
-        # All agents can read shared types
-        if entry.type in MemoryContract.SHARED_TYPES:
-            return True
-
-        return False
+        return _can_read(agent_id, entry.agent_id, entry.type)
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def can_write(agent_id: str, entry_type: MemoryType) -> bool:
         """Check if agent can write this memory type."""
-        # All agents can write their own status
-        if entry_type == MemoryType.AGENT_STATUS:
+        # All agents can write their own status and audit logs
+        if entry_type in MemoryContract._OPEN_WRITE_TYPES:
             return True
 
-        # All agents can write audit logs
-        if entry_type == MemoryType.AUDIT_LOG:
-            return True
-
-        # Type-specific permissions
-        type_permissions = {
-            MemoryType.INFERENCE: ["predictor", "visionary", "strategist"],
-            MemoryType.PREDICTION: ["predictor", "visionary"],
-            MemoryType.DEBATE: ["validator", "ceo"],
-            MemoryType.SIGNAL: ["crawler", "ingestor", "organizer"],
-            MemoryType.CONSENSUS: ["ceo", "validator"],
-            MemoryType.MUTATION: ["evolver", "ceo"],  # Note: evolver may be added
-        }
-
-        allowed_agents = type_permissions.get(entry_type, [])
-        return any(agent in agent_id for agent in allowed_agents)
+        allowed = MemoryContract.TYPE_PERMISSIONS.get(entry_type, _NO_ROLES)
+        return role_of(agent_id) in allowed
 
     @staticmethod
     def validate_write(agent_id: str, entry: MemorySchema) -> List[str]:
         """Validate a memory write operation. Returns list of violations."""
-        violations = []
+        return list(_validate_write(agent_id, entry.agent_id, entry.type))
+
+
+@lru_cache(maxsize=4096)
+def _can_read(agent_id: str, owner_id: str, entry_type: MemoryType) -> bool:
+    # Cheapest checks first: own memory, then shared types, then omniscience
+    if owner_id == agent_id:
+        return True
+    if entry_type in MemoryContract.SHARED_TYPES:
+        return True
+    return role_of(agent_id) in MemoryContract._OMNI
+
+
+@lru_cache(maxsize=1024)
+def _validate_write(
+    agent_id: str, owner_id: str, entry_type: MemoryType
+) -> Tuple[str, ...]:
+    # Permission tables are static at runtime, so results never go stale
+    violations = []
 
-        if not MemoryContract.can_write(agent_id, entry.type):
-            violations.append(
-                f"Agent {agent_id} not authorized to write {entry.type.value}"
-            )
+    if not MemoryContract.can_write(agent_id, entry_type):
+        violations.append(
+            f"Agent {agent_id} not authorized to write {entry_type.value}"
+        )
 
-        if entry.agent_id != agent_id:
-            violations.append(f"Agent {agent_id} cannot write as {entry.agent_id}")
+    if owner_id != agent_id:
+        violations.append(f"Agent {agent_id} cannot write as {owner_id}")
 
-        return violations
+    return tuple(violations)
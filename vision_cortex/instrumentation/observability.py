@@ -5,12 +5,27 @@ Replace with Prometheus/OpenTelemetry integrations in production.
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
 import os
-from collections import defaultdict
+import sys
+import threading
+import time
+from array import array
 from typing import Any, Dict
 
+try:
+    import orjson
+
+    def _dumps(payload: Dict[str, Any]) -> bytes:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
 _REDIS_URL = os.environ.get("REDIS_URL") or os.environ.get("CELERY_BROKER_URL")
 _redis = None
 if _REDIS_URL:
@@ -25,20 +40,43 @@ logger = logging.getLogger(__name__)
 
 
 class SimpleMetrics:
+    """Counters stored in a flat int64 array, indexed by registered name."""
+
     def __init__(self):
-        self._counters: Dict[str, int] = defaultdict(int)
+        self._idx: Dict[str, int] = {}
+        self._vals = array("q")
+        self._register_lock = threading.Lock()
+
+    def register(self, key: str) -> int:
+        """Assign (or return) the counter slot for ``key``."""
+        idx = self._idx.get(key)
+        if idx is None:
+            with self._register_lock:
+                idx = self._idx.get(key)
+                if idx is None:
+                    idx = len(self._vals)
+                    self._vals.append(0)
+                    self._idx[sys.intern(key)] = idx
+        return idx
 
     def increment(self, key: str, value: int = 1) -> None:
-        self._counters[key] += value
+        idx = self._idx.get(key)
+        if idx is None:
+            idx = self.register(key)
+        self._vals[idx] += value
 
     def get(self, key: str) -> int:
-        return self._counters.get(key, 0)
+        idx = self._idx.get(key)
+        return 0 if idx is None else self._vals[idx]
 
     def snapshot(self) -> Dict[str, int]:
-        return dict(self._counters)
+        vals = self._vals
+        return {key: vals[idx] for key, idx in self._idx.items()}
 
 
 metrics = SimpleMetrics()
+for _key in ("dispatch_quick_total", "execute_long_total", "enqueue_long_total"):
+    metrics.register(_key)
 
 try:
     from prometheus_client import CollectorRegistry, Counter
@@ -68,6 +106,8 @@ except Exception:
     PROM_REGISTRY = None
     PROM_DISPATCH_QUICK = None
     PROM_ENQUEUE_LONG = None
+    PROM_TASK_LATENCY = None
+    PROM_QUEUE_DEPTH = None
 
 
 # In-process task store for immediate tasks (task_id -> result/status)
@@ -75,14 +115,79 @@ def _redis_key(task_id: str) -> str:
     return f"vision_cortex:task:{task_id}"
 
 
+# Redis task writes are buffered and flushed with one MSET per window.
+# Entries stay in the buffer (where get_task finds them) until the MSET that
+# carries them succeeds; a failed MSET is retried with backoff.
+_FLUSH_INTERVAL_S = 0.005
+_FLUSH_RETRY_MAX_S = 30.0
+_PENDING_TASKS: Dict[str, Dict[str, Any]] = {}
+_pending_lock = threading.Lock()
+_flush_event = threading.Event()
+_flusher: threading.Thread | None = None
+
+
+def flush_tasks() -> bool:
+    """Write all buffered task payloads to Redis in a single MSET.
+
+    Returns False if the write failed; the payloads are then kept for the
+    next flush.
+    """
+    with _pending_lock:
+        if not _PENDING_TASKS:
+            return True
+        pending = dict(_PENDING_TASKS)
+    try:
+        _redis.mset(
+            {_redis_key(tid): _dumps(payload) for tid, payload in pending.items()}
+        )
+    except Exception:
+        logger.exception(
+            "Failed to store %d task(s) in Redis; will retry", len(pending)
+        )
+        return False
+    with _pending_lock:
+        for tid, payload in pending.items():
+            # Keep entries that were overwritten while the MSET was in flight
+            if _PENDING_TASKS.get(tid) is payload:
+                del _PENDING_TASKS[tid]
+    return True
+
+
+def _flush_loop() -> None:
+    retry = _FLUSH_INTERVAL_S
+    while True:
+        _flush_event.wait()
+        _flush_event.clear()
+        # Let concurrent writers join the batch before flushing
+        time.sleep(_FLUSH_INTERVAL_S)
+        if flush_tasks():
+            retry = _FLUSH_INTERVAL_S
+        else:
+            retry = min(retry * 2, _FLUSH_RETRY_MAX_S)
+            time.sleep(retry)
+            _flush_event.set()
+
+
+def _ensure_flusher() -> None:
+    global _flusher
+    if _flusher is not None:
+        return
+    with _pending_lock:
+        if _flusher is None:
+            _flusher = threading.Thread(
+                target=_flush_loop, name="vision_cortex-task-flusher", daemon=True
+            )
+            _flusher.start()
+            atexit.register(flush_tasks)
+
+
 def store_task(task_id: str, payload: Dict[str, Any]) -> None:
     """Store task payload in Redis if available, otherwise in-memory fallback."""
     if _redis:
-        try:
-            _redis.set(_redis_key(task_id), json.dumps(payload))
-        except Exception:
-            logger.exception("Failed to store task in Redis; falling back to in-memory")
-            _INPROC_TASK_STORE[task_id] = payload
+        _ensure_flusher()
+        with _pending_lock:
+            _PENDING_TASKS[task_id] = payload
+        _flush_event.set()
     else:
         _INPROC_TASK_STORE[task_id] = payload
 
@@ -90,10 +195,13 @@ def store_task(task_id: str, payload: Dict[str, Any]) -> None:
 def get_task(task_id: str) -> Dict[str, Any] | None:
     """Retrieve task payload from Redis or in-memory store."""
     if _redis:
+        pending = _PENDING_TASKS.get(task_id)
+        if pending is not None:
+            return pending
         try:
             val = _redis.get(_redis_key(task_id))
             if val:
-                return json.loads(val)
+                return _loads(val)
         except Exception:
             logger.exception("Failed to read task from Redis; checking in-memory store")
     return _INPROC_TASK_STORE.get(task_id)
@@ -5,7 +5,7 @@ and returns a configured SmartRouter for use by the gateway.
 from __future__ import annotations
 
 import logging
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Tuple
 
 from vision_cortex.agents.agent_builder import AgentBuilderAgent
 
@@ -28,19 +28,23 @@ class SimpleBus:
     """
 
     def __init__(self) -> None:
-        self._subs: Dict[str, list[Callable[[Dict[str, Any]], None]]] = {}
+        # Immutable per-topic snapshots, replaced (never mutated) on subscribe
+        self._subs: Dict[str, Tuple[Callable[[Dict[str, Any]], None], ...]] = {}
 
     def publish(self, topic: str, payload: Dict[str, Any]) -> None:
         # Log then call subscribers
         logger.debug("bus.publish topic=%s payload=%s", topic, payload)
-        for handler in self._subs.get(topic, []):
+        handlers = self._subs.get(topic)
+        if not handlers:
+            return
+        for handler in handlers:
             try:
                 handler(payload)
             except Exception:
                 logger.exception("bus handler error for topic %s", topic)
 
     def subscribe(self, topic: str, handler: Callable[[Dict[str, Any]], None]) -> None:
-        self._subs.setdefault(topic, []).append(handler)
+        self._subs[topic] = self._subs.get(topic, ()) + (handler,)
 
 
 def init_agents() -> SmartRouter:
@@ -7,10 +7,15 @@ Requires environment variables:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
+from typing import Any
 
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
+
+from vision_cortex.instrumentation.observability import flush_tasks
 
 logger = logging.getLogger(__name__)
 
@@ -20,28 +25,64 @@ BACKEND = os.environ.get("CELERY_BACKEND_URL", BROKER)
 celery_app = Celery("vision_cortex_tasks", broker=BROKER, backend=BACKEND)
 
 
+# Per-worker-process event loop and factory, reused across tasks
+_RUNNER: asyncio.Runner | None = None
+_FACTORY: Any = None
+
+
+@worker_process_init.connect
+def _init_worker_process(**_kwargs) -> None:
+    """Create the persistent loop runner and AgentFactory at worker boot."""
+    _get_runner()
+    try:
+        _get_factory()
+    except Exception:
+        # Surface the failure per task instead of killing the worker
+        logger.exception("AgentFactory init failed at worker boot")
+
+
+@worker_process_shutdown.connect
+def _shutdown_worker_process(**_kwargs) -> None:
+    """Write buffered task results before the pool child exits.
+
+    Prefork children leave through ``os._exit``, which skips ``atexit``.
+    """
+    flush_tasks()
+
+
+def _get_runner() -> asyncio.Runner:
+    global _RUNNER
+    if _RUNNER is None:
+        _RUNNER = asyncio.Runner()
+    return _RUNNER
+
+
+def _get_factory():
+    global _FACTORY
+    if _FACTORY is None:
+        from autonomy_stack.agent_factory import AgentFactory
+
+        _FACTORY = AgentFactory()
+    return _FACTORY
+
+
 @celery_app.task(bind=True)
 def execute_long_task(self, role: str, objective: str, context: dict | None = None):
     """Celery task wrapper that uses AgentFactory to execute a long-running task.
 
-    This task imports `autonomy_stack.agent_factory` at runtime to avoid import
-    errors in environments where the package isn't installed.
+    This task imports `autonomy_stack.agent_factory` lazily to avoid import
+    errors in environments where the package isn't installed. The factory
+    and event loop are created once per worker process and reused.
     """
     try:
-        from autonomy_stack.agent_factory import AgentFactory
+        factory = _get_factory()
     except Exception as e:
         logger.exception("AgentFactory import failed in Celery worker: %s", e)
         raise
 
-    factory = AgentFactory()
-    # AgentFactory.execute_task is async; we need to run it in event loop
+    # AgentFactory.execute_task is async; run it on the persistent loop
     try:
-        import asyncio
-
-        async def _run():
-            return await factory.execute_task(role, objective, context)
-
-        result = asyncio.get_event_loop().run_until_complete(_run())
+        result = _get_runner().run(factory.execute_task(role, objective, context))
         # Convert TaskResult to serializable dict if needed
         return {
             "task_id": result.task_id,
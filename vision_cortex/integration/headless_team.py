@@ -7,13 +7,77 @@ keeps dependencies minimal so it can run in environments without Playwright.
 
 from __future__ import annotations
 
+import asyncio
+import threading
 import time
 import urllib.robotparser
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import httpx
 
+# Connection pool shared by all fetches (keep-alive instead of a new
+# TCP/TLS handshake per URL)
+_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+_CLIENT: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+
+def _shared_client() -> httpx.Client:
+    global _CLIENT
+    if _CLIENT is None:
+        with _client_lock:
+            if _CLIENT is None:
+                _CLIENT = httpx.Client(limits=_LIMITS, follow_redirects=True)
+    return _CLIENT
+
+
+# Parsed robots.txt per origin: origin -> (expires_at, parser), LRU ordered
+_ROBOTS_MAXSIZE = 1024
+_ROBOTS_TTL_S = 3600.0
+_ROBOTS: "OrderedDict[str, Tuple[float, urllib.robotparser.RobotFileParser]]" = (
+    OrderedDict()
+)
+_robots_lock = threading.Lock()
+
+
+def _cached_robots(origin: str) -> Optional[urllib.robotparser.RobotFileParser]:
+    with _robots_lock:
+        hit = _ROBOTS.get(origin)
+        if hit is None:
+            return None
+        if hit[0] < time.monotonic():
+            del _ROBOTS[origin]
+            return None
+        _ROBOTS.move_to_end(origin)
+        return hit[1]
+
+
+def _store_robots(origin: str, rp: urllib.robotparser.RobotFileParser) -> None:
+    with _robots_lock:
+        _ROBOTS[origin] = (time.monotonic() + _ROBOTS_TTL_S, rp)
+        _ROBOTS.move_to_end(origin)
+        if len(_ROBOTS) > _ROBOTS_MAXSIZE:
+            _ROBOTS.popitem(last=False)
+
+
+def _fetch_robots(origin: str) -> Optional[urllib.robotparser.RobotFileParser]:
+    """Fetch and parse robots.txt, mirroring RobotFileParser.read() semantics."""
+    robots_url = f"{origin}/robots.txt"
+    r = _shared_client().get(robots_url, timeout=5)
+    rp = urllib.robotparser.RobotFileParser(robots_url)
+    if r.status_code in (401, 403):
+        rp.disallow_all = True
+    elif 400 <= r.status_code < 500:
+        rp.allow_all = True
+    elif r.status_code >= 500:
+        # transient server error: don't cache, caller treats as disallowed
+        return None
+    else:
+        rp.parse(r.text.splitlines())
+    return rp
+
 
 @dataclass
 class HeadlessAgentDesc:
@@ -45,20 +109,21 @@ def init_headless_team() -> List[HeadlessAgentDesc]:
 def allowed_by_robots(url: str, user_agent: str = "MCPHeadlessBot/1.0") -> bool:
     try:
         parsed = httpx.URL(url)
-        robots_url = f"{parsed.scheme}://{parsed.host}/robots.txt"
-        rp = urllib.robotparser.RobotFileParser()
-        rp.set_url(robots_url)
-        rp.read()
+        origin = f"{parsed.scheme}://{parsed.host}"
+        rp = _cached_robots(origin)
+        if rp is None:
+            rp = _fetch_robots(origin)
+            if rp is None:
+                return False
+            _store_robots(origin, rp)
         return rp.can_fetch(user_agent, url)
     except Exception:
         # if robots can't be read, be conservative and return False
         return False
 
 
-def fetch_url(
-    url: str, timeout: int = 15, user_agent: str = "MCPHeadlessBot/1.0"
-) -> Dict:
-    result = {
+def _new_result(url: str) -> Dict:
+    return {
         "url": url,
         "status": "error",
         "http_status": None,
@@ -66,21 +131,58 @@ def fetch_url(
         "text_excerpt": None,
         "duration_seconds": None,
     }
+
+
+def _fill_result(result: Dict, r: httpx.Response) -> None:
+    result["http_status"] = r.status_code
+    result["content_length"] = len(r.content or b"")
+    text = r.text or ""
+    result["text_excerpt"] = text[:2000]
+    result["status"] = "ok" if r.status_code < 400 else "error"
+
+
+def fetch_url(
+    url: str, timeout: int = 15, user_agent: str = "MCPHeadlessBot/1.0"
+) -> Dict:
+    result = _new_result(url)
     start = time.time()
     headers = {"User-Agent": user_agent}
     try:
-        with httpx.Client(
-            timeout=timeout, headers=headers, follow_redirects=True
-        ) as client:
-            r = client.get(url)
-            result["http_status"] = r.status_code
-            result["content_length"] = len(r.content or b"")
-            text = r.text or ""
-            result["text_excerpt"] = text[:2000]
-            result["status"] = "ok" if r.status_code < 400 else "error"
+        r = _shared_client().get(url, headers=headers, timeout=timeout)
+        _fill_result(result, r)
     except Exception as e:
         result["status"] = "error"
         result["error"] = str(e)
     finally:
         result["duration_seconds"] = time.time() - start
     return result
+
+
+async def _fetch_async(
+    client: httpx.AsyncClient, url: str, timeout: int, user_agent: str
+) -> Dict:
+    result = _new_result(url)
+    start = time.time()
+    try:
+        r = await client.get(url, headers={"User-Agent": user_agent}, timeout=timeout)
+        _fill_result(result, r)
+    except Exception as e:
+        result["status"] = "error"
+        result["error"] = str(e)
+    finally:
+        result["duration_seconds"] = time.time() - start
+    return result
+
+
+async def fetch_many(
+    urls: Iterable[str], timeout: int = 15, user_agent: str = "MCPHeadlessBot/1.0"
+) -> List[Dict]:
+    """Fetch several URLs concurrently over one pooled async client.
+
+    The async client is scoped to the call because its connections are
+    bound to the running event loop.
+    """
+    async with httpx.AsyncClient(limits=_LIMITS, follow_redirects=True) as client:
+        return await asyncio.gather(
+            *(_fetch_async(client, u, timeout, user_agent) for u in urls)
+        )
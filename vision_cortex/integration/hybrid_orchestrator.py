@@ -20,6 +20,12 @@ try:
 except Exception:
     AgentFactory = None
 
+try:
+    # Celery task is optional; resolved once here instead of per enqueue
+    from vision_cortex.integration.celery_app import execute_long_task
+except Exception:
+    execute_long_task = None
+
 from vision_cortex.agents.base_agent import AgentContext
 from vision_cortex.comms.router import SmartRouter
 from vision_cortex.instrumentation import observability as obs
@@ -50,6 +56,11 @@ class HybridOrchestrator:
         self.use_celery = (
             use_celery and os.environ.get("USE_CELERY", "false").lower() == "true"
         )
+        if self.use_celery and execute_long_task is None:
+            logger.warning(
+                "USE_CELERY set but Celery task unavailable; running in-process"
+            )
+            self.use_celery = False
         self._queue = None
         if self.use_celery:
             logger.info("HybridOrchestrator using Celery (configured via USE_CELERY)")
@@ -102,17 +113,14 @@ class HybridOrchestrator:
         try:
             if PROM_QUEUE_DEPTH and obs._redis:
                 try:
-                    obs._redis.incr("vision_cortex:queue_depth")
-                    val = obs._redis.get("vision_cortex:queue_depth") or 0
-                    PROM_QUEUE_DEPTH.set(int(val))
+                    # INCR returns the new value; no follow-up GET needed
+                    PROM_QUEUE_DEPTH.set(obs._redis.incr("vision_cortex:queue_depth"))
                 except Exception:
                     logger.debug("Failed to increment Redis queue depth")
         except Exception:
             logger.debug("Queue depth metric update (enqueue) failed")
         if self.use_celery:
             try:
-                from vision_cortex.integration.celery_app import execute_long_task
-
                 # call Celery task asynchronously
                 async_result = execute_long_task.delay(role, objective, context)
                 return {
@@ -135,9 +143,7 @@ class HybridOrchestrator:
         try:
             if PROM_QUEUE_DEPTH and obs._redis:
                 try:
-                    obs._redis.decr("vision_cortex:queue_depth")
-                    val = obs._redis.get("vision_cortex:queue_depth") or 0
-                    PROM_QUEUE_DEPTH.set(int(val))
+                    PROM_QUEUE_DEPTH.set(obs._redis.decr("vision_cortex:queue_depth"))
                 except Exception:
                     logger.debug("Failed to update Redis queue depth metric")
         except Exception:
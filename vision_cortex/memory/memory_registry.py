@@ -6,10 +6,34 @@ local runs do not require cloud credentials.
 
 from __future__ import annotations
 
+import atexit
+import heapq
 import logging
+import random
+import threading
 import time
+import weakref
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Protocol
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+# Optional JIT for the MinHash kernel; pure Python is used without it
+try:
+    import numba
+    import numpy as np
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
 
 
 class FirestoreClient(Protocol):
@@ -24,6 +48,29 @@ class VectorStore(Protocol):
     def search(self, query: str, k: int = 5) -> Any: ...
 
 
+# Firestore accepts at most 500 writes per batch commit
+FIRESTORE_BATCH_LIMIT = 500
+
+# Registries with coalesced writes, flushed by one exit hook
+_BATCHING_REGISTRIES: "weakref.WeakValueDictionary[int, MemoryRegistry]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _flush_at_exit() -> None:
+    for registry in list(_BATCHING_REGISTRIES.values()):
+        try:
+            registry.flush()
+        except Exception:
+            registry.logger.error(
+                "Dropping %d unflushed memory event(s) at exit",
+                len(registry._pending),
+            )
+
+
+atexit.register(_flush_at_exit)
+
+
 @dataclass
 class MemoryRegistry:
     firestore: FirestoreClient
@@ -31,14 +78,82 @@ class MemoryRegistry:
     logger: logging.Logger = field(
         default_factory=lambda: logging.getLogger("vision_cortex.memory")
     )
+    # When set, persist_event coalesces writes and flushes them in batches
+    # after this many seconds; None keeps writes synchronous.
+    flush_interval: Optional[float] = None
+    _pending: List[Dict[str, Any]] = field(default_factory=list, init=False, repr=False)
+    _pending_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+    _flush_timer: Optional[threading.Timer] = field(
+        default=None, init=False, repr=False
+    )
 
     def persist_event(self, doc: Dict[str, Any]) -> None:
+        if self.flush_interval:
+            with self._pending_lock:
+                self._pending.append(doc)
+                self._arm_flush_timer()
+            return
         try:
             self.firestore.write("mcp_memory", doc)
         except Exception as exc:
             self.logger.error("Persist event failed: %s", exc)
             raise
 
+    def persist_events(
+        self, docs: List[Dict[str, Any]], collection: str = "mcp_memory"
+    ) -> None:
+        """Write many docs, using batched commits when the backend supports it."""
+        batch_write = getattr(self.firestore, "batch_write", None)
+        try:
+            if batch_write is None:
+                for doc in docs:
+                    self.firestore.write(collection, doc)
+                return
+            for start in range(0, len(docs), FIRESTORE_BATCH_LIMIT):
+                batch_write(collection, docs[start : start + FIRESTORE_BATCH_LIMIT])
+        except Exception as exc:
+            self.logger.error("Persist events failed: %s", exc)
+            raise
+
+    def _arm_flush_timer(self) -> None:
+        # Caller holds _pending_lock
+        if self._flush_timer is None:
+            _BATCHING_REGISTRIES[id(self)] = self
+            self._flush_timer = threading.Timer(
+                self.flush_interval, self._flush_on_timer
+            )
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _flush_on_timer(self) -> None:
+        try:
+            self.flush()
+        except Exception:
+            # Logged by persist_events and requeued by flush; try again later
+            with self._pending_lock:
+                self._arm_flush_timer()
+
+    def flush(self) -> None:
+        """Write any coalesced persist_event docs now.
+
+        Docs that could not be written go back to the head of the queue
+        and the error is raised.
+        """
+        with self._pending_lock:
+            docs, self._pending = self._pending, []
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        for start in range(0, len(docs), FIRESTORE_BATCH_LIMIT):
+            try:
+                self.persist_events(docs[start : start + FIRESTORE_BATCH_LIMIT])
+            except Exception:
+                with self._pending_lock:
+                    self._pending[:0] = docs[start:]
+                raise
+
     def add_embedding(self, text: str, metadata: Dict[str, Any]) -> str:
         try:
             return self.vector_store.add(text=text, metadata=metadata)
@@ -63,34 +178,197 @@ class InMemoryFirestore(FirestoreClient):
         return list(self._collections.get(collection, []))
 
 
+# MinHash LSH parameters: k-character shingles hashed with a Rabin-Karp
+# rolling hash mod a Mersenne prime, M permutations split into B bands of R.
+SHINGLE_K = 5
+MINHASH_PRIME = (1 << 31) - 1
+MINHASH_BASE = 257
+MINHASH_PERMS = 64
+LSH_BANDS = 16
+LSH_ROWS = MINHASH_PERMS // LSH_BANDS
+
+_perm_rng = random.Random(0x5EED)
+_PERM_A: Tuple[int, ...] = tuple(
+    _perm_rng.randrange(1, MINHASH_PRIME) for _ in range(MINHASH_PERMS)
+)
+_PERM_B: Tuple[int, ...] = tuple(
+    _perm_rng.randrange(0, MINHASH_PRIME) for _ in range(MINHASH_PERMS)
+)
+
+
+def _shingle_hashes(text: str, k: int = SHINGLE_K) -> Set[int]:
+    """Rolling hashes of every k-character shingle in ``text``."""
+    codes = [ord(c) for c in text]
+    if len(codes) < k:
+        k = len(codes)
+        if not k:
+            return set()
+    p, q = MINHASH_PRIME, MINHASH_BASE
+    lead = pow(q, k - 1, p)
+    h = 0
+    for c in codes[:k]:
+        h = (h * q + c) % p
+    hashes = {h}
+    for i in range(k, len(codes)):
+        h = ((h - codes[i - k] * lead) * q + codes[i]) % p
+        hashes.add(h)
+    return hashes
+
+
+def _minhash_signature(
+    hashes: Set[int], perms_a: Sequence[int], perms_b: Sequence[int]
+) -> Tuple[int, ...]:
+    """Minimum of each universal-hash permutation over the shingle set."""
+    p = MINHASH_PRIME
+    if not hashes:
+        return tuple(p for _ in perms_a)
+    return tuple(min((a * x + b) % p for x in hashes) for a, b in zip(perms_a, perms_b))
+
+
+if HAS_NUMBA:
+    _PERM_A_ARR = np.array(_PERM_A, dtype=np.int64)
+    _PERM_B_ARR = np.array(_PERM_B, dtype=np.int64)
+
+    @numba.njit(cache=True, boundscheck=False, error_model="numpy")
+    def _minhash_kernel(codes, k, perms_a, perms_b, p, q):
+        """Fused rolling-hash + MinHash loop; same result as the Python path."""
+        m = perms_a.shape[0]
+        sig = np.full(m, p, dtype=np.int64)
+        n = codes.shape[0]
+        if n == 0:
+            return sig
+        if n < k:
+            k = n
+        lead = 1
+        for _ in range(k - 1):
+            lead = (lead * q) % p
+        h = 0
+        for i in range(k):
+            h = (h * q + codes[i]) % p
+        for j in range(m):
+            v = (perms_a[j] * h + perms_b[j]) % p
+            if v < sig[j]:
+                sig[j] = v
+        for i in range(k, n):
+            h = ((h - codes[i - k] * lead) * q + codes[i]) % p
+            for j in range(m):
+                v = (perms_a[j] * h + perms_b[j]) % p
+                if v < sig[j]:
+                    sig[j] = v
+        return sig
+
+
 class InMemoryVectorStore(VectorStore):
-    """Toy vector store that keeps text and metadata for retrieval tests."""
+    """Toy vector store that keeps text and metadata for retrieval tests.
 
-    def __init__(self) -> None:
+    By default ``search`` ranks by exact token overlap. With ``lsh=True``
+    records are also sketched with MinHash and ``search`` retrieves
+    candidates from LSH band buckets, scoring by estimated Jaccard
+    similarity of character shingles.
+    """
+
+    def __init__(self, lsh: bool = False) -> None:
         self._records: List[Dict[str, Any]] = []
+        # Tokenised once on insert, parallel to _records
+        self._tokens: List[FrozenSet[str]] = []
+        # token -> indices of records containing it
+        self._index: Dict[str, List[int]] = {}
+        self._lsh = lsh
+        self._signatures: List[Tuple[int, ...]] = []
+        # (band, band signature) -> indices of records in that bucket
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
 
     def add(self, text: str, metadata: Dict[str, Any]) -> str:
-        record_id = f"vec-{len(self._records)+1}"
+        idx = len(self._records)
+        record_id = f"vec-{idx+1}"
+        tokens = frozenset(text.lower().split())
         self._records.append(
             {"id": record_id, "text": text, "metadata": metadata, "ts": time.time()}
         )
+        self._tokens.append(tokens)
+        for token in tokens:
+            self._index.setdefault(token, []).append(idx)
+        if self._lsh:
+            sig = self._signature(text)
+            self._signatures.append(sig)
+            for band in range(LSH_BANDS):
+                key = (band, sig[band * LSH_ROWS : (band + 1) * LSH_ROWS])
+                self._buckets.setdefault(key, []).append(idx)
         return record_id
 
+    @staticmethod
+    def _signature(text: str) -> Tuple[int, ...]:
+        text = text.lower()
+        if HAS_NUMBA:
+            codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+            sig = _minhash_kernel(
+                codes.astype(np.int64),
+                SHINGLE_K,
+                _PERM_A_ARR,
+                _PERM_B_ARR,
+                MINHASH_PRIME,
+                MINHASH_BASE,
+            )
+            return tuple(int(v) for v in sig)
+        return _minhash_signature(_shingle_hashes(text), _PERM_A, _PERM_B)
+
     def search(self, query: str, k: int = 5) -> Any:
-        # Naive search: return most recent k entries containing any query token.
+        if self._lsh:
+            return self._search_lsh(query, k)
+        # Rank records sharing query tokens by overlap, then recency; pad with
+        # the most recent non-matching records so up to k are returned.
         tokens = set(query.lower().split())
-        scored: List[Dict[str, Any]] = []
-        for rec in self._records:
-            text_tokens = set(rec["text"].lower().split())
-            overlap = tokens & text_tokens
-            score = len(overlap)
-            scored.append({"record": rec, "score": score})
-        scored.sort(key=lambda r: (r["score"], r["record"]["ts"]), reverse=True)
-        return scored[:k]
+        candidates: Set[int] = set()
+        for token in tokens:
+            candidates.update(self._index.get(token, ()))
 
+        records, rec_tokens = self._records, self._tokens
+        top = heapq.nlargest(
+            k,
+            candidates,
+            key=lambda i: (len(tokens & rec_tokens[i]), records[i]["ts"], i),
+        )
+        scored = [
+            {"record": records[i], "score": len(tokens & rec_tokens[i])} for i in top
+        ]
+        return self._pad_recent(scored, candidates, k)
+
+    def _search_lsh(self, query: str, k: int) -> Any:
+        sig = self._signature(query)
+        candidates: Set[int] = set()
+        for band in range(LSH_BANDS):
+            key = (band, sig[band * LSH_ROWS : (band + 1) * LSH_ROWS])
+            candidates.update(self._buckets.get(key, ()))
+
+        records, signatures = self._records, self._signatures
+
+        def similarity(i: int) -> float:
+            return sum(a == b for a, b in zip(sig, signatures[i])) / MINHASH_PERMS
+
+        top = heapq.nlargest(
+            k, candidates, key=lambda i: (similarity(i), records[i]["ts"], i)
+        )
+        scored = [{"record": records[i], "score": similarity(i)} for i in top]
+        return self._pad_recent(scored, candidates, k)
 
-def build_memory_registry() -> MemoryRegistry:
-    """Factory that prefers Firestore if available, otherwise in-memory."""
+    def _pad_recent(
+        self, scored: List[Dict[str, Any]], exclude: Set[int], k: int
+    ) -> List[Dict[str, Any]]:
+        """Fill up to k results with the most recent non-candidate records."""
+        records = self._records
+        i = len(records) - 1
+        while len(scored) < k and i >= 0:
+            if i not in exclude:
+                scored.append({"record": records[i], "score": 0})
+            i -= 1
+        return scored
+
+
+def build_memory_registry(flush_interval: Optional[float] = None) -> MemoryRegistry:
+    """Factory that prefers Firestore if available, otherwise in-memory.
+
+    ``flush_interval`` opts in to coalesced persist_event writes.
+    """
 
     try:
         from google.cloud import firestore  # type: ignore
@@ -101,6 +379,13 @@ def build_memory_registry() -> MemoryRegistry:
             def write(self, collection: str, doc: Dict[str, Any]) -> None:
                 client.collection(collection).add(doc)
 
+            def batch_write(self, collection: str, docs: List[Dict[str, Any]]) -> None:
+                col = client.collection(collection)
+                batch = client.batch()
+                for doc in docs:
+                    batch.set(col.document(), doc)
+                batch.commit()
+
             def query(self, collection: str, **kwargs: Any) -> Any:
                 col = client.collection(collection)
                 # Basic passthrough; more filters can be layered as needed.
@@ -108,13 +393,17 @@ def build_memory_registry() -> MemoryRegistry:
                 return [d.to_dict() for d in docs]
 
         registry = MemoryRegistry(
-            firestore=FirestoreAdapter(), vector_store=InMemoryVectorStore()
+            firestore=FirestoreAdapter(),
+            vector_store=InMemoryVectorStore(),
+            flush_interval=flush_interval,
         )
         registry.logger.info("Using Firestore-backed MemoryRegistry")
         return registry
     except Exception:
         registry = MemoryRegistry(
-            firestore=InMemoryFirestore(), vector_store=InMemoryVectorStore()
+            firestore=InMemoryFirestore(),
+            vector_store=InMemoryVectorStore(),
+            flush_interval=flush_interval,
         )
         registry.logger.info("Using InMemory MemoryRegistry (Firestore unavailable)")
         return registry
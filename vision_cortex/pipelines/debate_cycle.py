@@ -7,11 +7,33 @@ produce a consensus view and log dissent.
 from __future__ import annotations
 
 import statistics
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Any, Dict, List
 
 from vision_cortex.agents.base_agent import AgentContext, BaseAgent
+from vision_cortex.agents.run_cache import cached_run
 from vision_cortex.schemas.contracts import DebateResult, DebateTurn
 
+# Optional vectorised median for large debates; statistics.median otherwise
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# Below this many confidences the numpy array setup costs more than it saves.
+NUMPY_MEDIAN_MIN = 64
+
+# Shared by every debate cycle so each run reuses warm threads instead of
+# starting and joining a pool of its own. Workers start on first use and are
+# joined at interpreter exit by concurrent.futures.
+DEBATE_POOL_WORKERS = 4
+_DEBATE_POOL = ThreadPoolExecutor(
+    max_workers=DEBATE_POOL_WORKERS, thread_name_prefix="vc-debate"
+)
+
 
 class DebateCycle:
     def __init__(
@@ -34,52 +56,93 @@ class DebateCycle:
         ctx = AgentContext(
             session_id=session_id, task_id=task_id, governance_level="MEDIUM"
         )
-        preds = self.predictor.run_task(ctx, {"organized": organized})
-        visions = self.visionary.run_task(ctx, preds)
-        strategies = self.strategist.run_task(
-            ctx, {"scenarios": visions, "predictions": preds}
+        preds = cached_run(self.predictor, ctx, {"organized": organized})
+        if not preds.get("predictions"):
+            # Nothing to debate: skip the downstream agents entirely.
+            return {
+                "predictions": preds,
+                "visions": {},
+                "strategies": {},
+                "validations": {},
+                "document": {},
+                "debate": DebateResult(
+                    topic="vision_cortex_debate",
+                    turns=[],
+                    consensus=None,
+                    consensus_confidence=0.0,
+                    dissenting=[],
+                    metrics={"turns": 0, "dissent": 0},
+                ),
+            }
+        visions = cached_run(self.visionary, ctx, preds)
+        # Strategist and validator both depend only on preds + visions; the
+        # validator runs here while the strategist runs on the shared pool.
+        fut_strat = _DEBATE_POOL.submit(
+            cached_run,
+            self.strategist,
+            ctx,
+            {"scenarios": visions, "predictions": preds},
         )
-        validations = self.validator.run_task(
-            ctx, {"predictions": preds, "scenarios": visions}
+        validations = cached_run(
+            self.validator, ctx, {"predictions": preds, "scenarios": visions}
         )
+        strategies = fut_strat.result()
         actions = strategies.get("steps", [])
-        doc = self.documentor.run_task(
-            ctx, {"predictions": preds, "steps": strategies, "actions": actions}
+        doc = cached_run(
+            self.documentor,
+            ctx,
+            {"predictions": preds, "steps": strategies, "actions": actions},
         )
 
-        turns = [
-            DebateTurn(
-                role="predictor",
-                agent=self.predictor.name,
-                position=str(p.get("statement")),
-                tag=p.get("tag", "UNCERTAIN"),
-                confidence=p.get("confidence", 0.5),
-                rationale="trend synthesis",
-            )
-            for p in preds.get("predictions", [])
-        ]
-        turns.extend(
-            DebateTurn(
-                role="validator",
-                agent=self.validator.name,
-                position=str(r),
-                tag="REAL-TODAY",
-                confidence=0.6,
-                rationale="policy enforcement",
-                dissent=True,
+        predictor_name = self.predictor.name
+        validator_name = self.validator.name
+        # Positional DebateTurn(role, agent, position, tag, confidence,
+        # rationale, evidence, dissent) avoids a kwargs dict per turn.
+        turns = list(
+            chain(
+                (
+                    DebateTurn(
+                        "predictor",
+                        predictor_name,
+                        str(p.get("statement")),
+                        p.get("tag", "UNCERTAIN"),
+                        p.get("confidence", 0.5),
+                        "trend synthesis",
+                    )
+                    for p in preds.get("predictions", ())
+                ),
+                (
+                    DebateTurn(
+                        "validator",
+                        validator_name,
+                        str(r),
+                        "REAL-TODAY",
+                        0.6,
+                        "policy enforcement",
+                        [],
+                        True,
+                    )
+                    for r in validations.get("risks", ())
+                ),
             )
-            for r in validations.get("risks", [])
         )
-        consensus, consensus_conf = self._compute_consensus(turns)
+        confidences = []
+        dissenting = []
+        for t in turns:
+            if t.dissent:
+                dissenting.append(t)
+            else:
+                confidences.append(t.confidence)
+        consensus, consensus_conf = self._compute_consensus(turns, confidences)
         result = DebateResult(
             topic="vision_cortex_debate",
             turns=turns,
             consensus=consensus,
             consensus_confidence=consensus_conf,
-            dissenting=[t for t in turns if t.dissent],
+            dissenting=dissenting,
             metrics={
                 "turns": len(turns),
-                "dissent": len([t for t in turns if t.dissent]),
+                "dissent": len(dissenting),
             },
         )
         return {
@@ -91,11 +154,13 @@ class DebateCycle:
             "debate": result,
         }
 
-    def _compute_consensus(self, turns: Any) -> Any:
+    def _compute_consensus(self, turns: Any, confidences: List[float]) -> Any:
         if not turns:
             return None, 0.0
-        confidences = [t.confidence for t in turns if not t.dissent]
         if not confidences:
             return "no-consensus", 0.0
-        median_conf = statistics.median(confidences)
+        if HAS_NUMPY and len(confidences) > NUMPY_MEDIAN_MIN:
+            median_conf = float(np.median(np.fromiter(confidences, dtype=np.float64)))
+        else:
+            median_conf = statistics.median(confidences)
         return "proceed", median_conf
@@ -24,10 +24,19 @@ from vision_cortex.agents import (
     ValidatorAgent,
     VisionaryAgent,
 )
-from vision_cortex.agents.base_agent import AgentContext
+from vision_cortex.agents.base_agent import AgentChain, AgentContext
+from vision_cortex.agents.run_cache import cached_run, shared_encoding
 from vision_cortex.memory.memory_registry import MemoryRegistry
 from vision_cortex.validators.safety import enforce_governance
 
+# Shared by every orchestrator so repeated builds reuse warm workers without
+# each instance holding its own threads. Workers start on first use and are
+# joined at interpreter exit by concurrent.futures.
+BUILD_POOL_WORKERS = 8
+_BUILD_POOL = ThreadPoolExecutor(
+    max_workers=BUILD_POOL_WORKERS, thread_name_prefix="vc-build"
+)
+
 
 class SystemBuildOrchestrator:
     def __init__(
@@ -110,12 +119,18 @@ class SystemBuildOrchestrator:
             memory=memory,
             governance_level=self.governance_level,
         )
+        self._chain = AgentChain(
+            bus=bus, memory=memory, name="system_build", runner=cached_run
+        )
+        self._pool = _BUILD_POOL
 
     def run_build(self, seed: Dict[str, Any], parallel: bool = True) -> Dict[str, Any]:
         session_id = seed.get("session_id") or str(uuid.uuid4())
-        governance = enforce_governance(
-            seed.get("governance_level", self.governance_level)
-        )
+        # self.governance_level was validated in __init__; only re-check overrides.
+        if "governance_level" in seed:
+            governance = enforce_governance(seed["governance_level"])
+        else:
+            governance = self.governance_level
         context = AgentContext(
             session_id=session_id,
             task_id=str(uuid.uuid4()),
@@ -126,10 +141,10 @@ class SystemBuildOrchestrator:
         # Phase 1: crawl and ingest can run in parallel for speed.
         observations: List[Dict[str, Any]] = []
         ingested: Dict[str, Any] = {}
-        with ThreadPoolExecutor(max_workers=2 if parallel else 1) as pool:
+        if parallel:
             futures = {
-                pool.submit(self.crawler.run_task, context, seed): "crawl",
-                pool.submit(self.ingestor.run_task, context, seed): "ingest",
+                self._pool.submit(self.crawler.run_task, context, seed): "crawl",
+                self._pool.submit(self.ingestor.run_task, context, seed): "ingest",
             }
             for future in as_completed(futures):
                 label = futures[future]
@@ -138,25 +153,78 @@ class SystemBuildOrchestrator:
                     observations = result.get("observations", [])
                 elif label == "ingest":
                     ingested = result
+        else:
+            observations = self.crawler.run_task(context, seed).get("observations", [])
+            ingested = self.ingestor.run_task(context, seed)
 
-        organized = self.organizer.run_task(
-            context, {"observations": observations, "ingested": ingested}
-        )
-        strategy = self.strategist.run_task(context, {"organized": organized})
-        vision = self.visionary.run_task(context, {"strategy": strategy, "seed": seed})
-        forecast = self.predictor.run_task(context, {"vision": vision})
-        validation = self.validator.run_task(
-            context, {"forecast": forecast, "organized": organized}
-        )
-        doc = self.documentor.run_task(
-            context, {"vision": vision, "strategy": strategy, "validation": validation}
-        )
-        executive = self.ceo.run_task(
-            context, {"doc": doc, "forecast": forecast, "validation": validation}
-        )
-        evolved = self.evolver.run_task(
-            context, {"build": executive, "vision": vision, "strategy": strategy}
-        )
+        # Dependent stages run as one fused chain: a single governance check
+        # and one coalesced log event instead of one per agent. Stage outputs
+        # reused by several stages are encoded once for run-cache keys.
+        with shared_encoding():
+            results = self._chain.run(
+                context,
+                [
+                    (
+                        "organized",
+                        self.organizer,
+                        lambda r: {"observations": observations, "ingested": ingested},
+                    ),
+                    (
+                        "strategy",
+                        self.strategist,
+                        lambda r: {"organized": r["organized"]},
+                    ),
+                    (
+                        "vision",
+                        self.visionary,
+                        lambda r: {"strategy": r["strategy"], "seed": seed},
+                    ),
+                    ("forecast", self.predictor, lambda r: {"vision": r["vision"]}),
+                    (
+                        "validation",
+                        self.validator,
+                        lambda r: {
+                            "forecast": r["forecast"],
+                            "organized": r["organized"],
+                        },
+                    ),
+                    (
+                        "doc",
+                        self.documentor,
+                        lambda r: {
+                            "vision": r["vision"],
+                            "strategy": r["strategy"],
+                            "validation": r["validation"],
+                        },
+                    ),
+                    (
+                        "executive",
+                        self.ceo,
+                        lambda r: {
+                            "doc": r["doc"],
+                            "forecast": r["forecast"],
+                            "validation": r["validation"],
+                        },
+                    ),
+                    (
+                        "evolved",
+                        self.evolver,
+                        lambda r: {
+                            "build": r["executive"],
+                            "vision": r["vision"],
+                            "strategy": r["strategy"],
+                        },
+                    ),
+                ],
+            )
+        organized = results["organized"]
+        strategy = results["strategy"]
+        vision = results["vision"]
+        forecast = results["forecast"]
+        validation = results["validation"]
+        doc = results["doc"]
+        executive = results["executive"]
+        evolved = results["evolved"]
 
         summary = {
             "session_id": session_id,
@@ -172,11 +240,17 @@ class SystemBuildOrchestrator:
             "evolved": evolved,
             "timestamp": time.time(),
         }
+        # Persisted and published before returning, so callers that read
+        # memory or bus events right after run_build see this build.
+        self._finalize(summary, governance)
+        return summary
+
+    def _finalize(self, summary: Dict[str, Any], governance: str) -> None:
         if self.memory:
             self.memory.persist_event(
                 {
                     "type": "system_build_summary",
-                    "session_hash": session_id,
+                    "session_hash": summary["session_id"],
                     "content": summary,
                     "confidence": 0.65,
                     "governance_level": governance,
@@ -184,6 +258,5 @@ class SystemBuildOrchestrator:
                 }
             )
         self.bus.publish(
-            "build_completed", {"session_id": session_id, "summary": summary}
+            "build_completed", {"session_id": summary["session_id"], "summary": summary}
         )
-        return summary
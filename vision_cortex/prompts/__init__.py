@@ -1,7 +1,6 @@
 from vision_cortex.prompts.executor import PromptExecutor
 from vision_cortex.prompts.registry import (
     ALIASES,
-    PROMPT_REGISTRY,
     PromptDefinition,
     list_prompts,
     resolve_alias,
@@ -15,3 +14,12 @@ __all__ = [
     "list_prompts",
     "resolve_alias",
 ]
+
+
+def __getattr__(name: str):
+    # PROMPT_REGISTRY is built lazily by the registry module.
+    if name == "PROMPT_REGISTRY":
+        from vision_cortex.prompts import registry
+
+        return registry.PROMPT_REGISTRY
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
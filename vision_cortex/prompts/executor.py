@@ -2,16 +2,16 @@
 
 from __future__ import annotations
 
+import os
 import time
-import uuid
-from typing import Any, Dict, Optional
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple, Union
 
 from vision_cortex.agents.base_agent import AgentContext
 from vision_cortex.comms.message_bus import MessageBus
 from vision_cortex.memory.memory_registry import MemoryRegistry
 from vision_cortex.pipelines.system_build import SystemBuildOrchestrator
-from vision_cortex.prompts.registry import resolve_alias
-from vision_cortex.validators.safety import enforce_governance
+from vision_cortex.prompts.registry import PromptDefinition, resolve_alias
+from vision_cortex.validators.safety import GOVERNANCE_LEVELS
 
 
 class PromptExecutor:
@@ -21,68 +21,170 @@ class PromptExecutor:
         self.bus = bus
         self.memory = memory
         self.orchestrator = SystemBuildOrchestrator(bus=bus, memory=memory)
+        # Bound once; execute/run_fused call these per prompt.
+        self._run_build = self.orchestrator.run_build
+        self._persist = memory.persist_event if memory else None
 
     def execute(
         self,
-        prompt_or_alias: str,
+        prompt_or_alias: Union[str, PromptDefinition],
         params: Optional[Dict[str, Any]] = None,
         confidence: float = 0.5,
     ) -> Dict[str, Any]:
-        prompt = resolve_alias(prompt_or_alias)
+        prompt = (
+            prompt_or_alias
+            if isinstance(prompt_or_alias, PromptDefinition)
+            else resolve_alias(prompt_or_alias)
+        )
         if prompt is None:
             return {"error": f"Unknown prompt or alias: {prompt_or_alias}"}
 
-        governance = enforce_governance(prompt.governance_level)
-        session_id = str(uuid.uuid4())
+        governance = prompt.resolved_governance
+        session_id = os.urandom(16).hex()
         context = AgentContext(
             session_id=session_id,
-            task_id=str(uuid.uuid4()),
+            task_id=os.urandom(16).hex(),
             governance_level=governance,
             confidence=confidence,
         )
 
         # Decide execution path based on prompt execution mode and confidence
-        if prompt.execution == "auto" and confidence < prompt.confidence_threshold:
-            return {
-                "status": "deferred",
-                "prompt_id": prompt.id,
-                "reason": f"Confidence {confidence:.2f} below threshold {prompt.confidence_threshold:.2f}",
-                "session_id": session_id,
-            }
+        if self._below_threshold(prompt, confidence):
+            return self._deferred(prompt, confidence, session_id)
 
         # Build seed from prompt parameters merged with runtime params
-        seed: Dict[str, Any] = {
-            **prompt.parameters,
-            **(params or {}),
+        seed: Dict[str, Any] = prompt.parameters.copy()
+        if params:
+            seed.update(params)
+        seed["session_id"] = session_id
+        seed["governance_level"] = governance
+        seed["prompt_id"] = prompt.id
+        seed["agents"] = prompt.agents
+
+        result = self._run_build(seed, parallel=True)
+        self._record(prompt, session_id, confidence, governance, result)
+
+        return {
+            "status": "completed",
+            "prompt_id": prompt.id,
+            "level": prompt.level,
             "session_id": session_id,
             "governance_level": governance,
-            "prompt_id": prompt.id,
-            "agents": prompt.agents,
+            "result": result,
         }
 
-        result = self.orchestrator.run_build(seed, parallel=True)
+    def run_fused(
+        self,
+        prompts_or_aliases: Sequence[Union[str, PromptDefinition]],
+        params: Optional[Dict[str, Any]] = None,
+        confidence: float = 0.5,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Execute several prompts, sharing one build between related prompts.
 
-        # Persist prompt execution record
-        if self.memory:
-            self.memory.persist_event(
-                {
-                    "type": "prompt_execution",
+        A prompt joins the group of any prompt whose agents include all of its
+        own, irrespective of order: AUTO_VALIDATE (validator) and AUTO_MAINTAIN
+        (validator, evolver) both fuse into AUTO_HEAL (evolver, validator,
+        strategist). Each group runs one orchestrator build with the agents of
+        its largest member, under the strictest governance level of the group.
+        Results are keyed by the alias or id as passed in, or by ``prompt.id``
+        for PromptDefinitions passed directly.
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        runnable: List[Tuple[str, PromptDefinition]] = []
+        for entry in prompts_or_aliases:
+            if isinstance(entry, PromptDefinition):
+                name, prompt = entry.id, entry
+            else:
+                name, prompt = entry, resolve_alias(entry)
+            if prompt is None:
+                results[name] = {"error": f"Unknown prompt or alias: {name}"}
+            elif self._below_threshold(prompt, confidence):
+                results[name] = self._deferred(prompt, confidence, os.urandom(16).hex())
+            else:
+                runnable.append((name, prompt))
+
+        # Largest agent sets first, so each group is founded by the prompt
+        # whose agents cover the rest; members keep their request order.
+        founders: Dict[FrozenSet[str], Tuple[str, ...]] = {}
+        group_of: Dict[int, FrozenSet[str]] = {}
+        by_size = sorted(
+            range(len(runnable)), key=lambda i: -len(set(runnable[i][1].agents))
+        )
+        for i in by_size:
+            agent_set = frozenset(runnable[i][1].agents)
+            key = next((k for k in founders if agent_set <= k), None)
+            if key is None:
+                key = agent_set
+                founders[key] = runnable[i][1].agents
+            group_of[i] = key
+        groups: Dict[FrozenSet[str], List[Tuple[str, PromptDefinition]]] = {}
+        for i, member in enumerate(runnable):
+            groups.setdefault(group_of[i], []).append(member)
+
+        for key, members in groups.items():
+            agents = founders[key]
+            governance = max(
+                (p.resolved_governance for _, p in members),
+                key=GOVERNANCE_LEVELS.index,
+            )
+            session_id = os.urandom(16).hex()
+            prompt_ids = [p.id for _, p in members]
+            seed: Dict[str, Any] = {}
+            for _, prompt in members:
+                seed.update(prompt.parameters)
+            if params:
+                seed.update(params)
+            seed.update(
+                session_id=session_id,
+                governance_level=governance,
+                prompt_id=prompt_ids[0],
+                prompt_ids=prompt_ids,
+                agents=agents,
+            )
+
+            result = self._run_build(seed, parallel=True)
+            for name, prompt in members:
+                self._record(prompt, session_id, confidence, governance, result)
+                results[name] = {
+                    "status": "completed",
                     "prompt_id": prompt.id,
                     "level": prompt.level,
-                    "execution_mode": prompt.execution,
-                    "session_hash": session_id,
-                    "confidence": confidence,
+                    "session_id": session_id,
                     "governance_level": governance,
-                    "result_summary": result.get("executive"),
-                    "created_at": time.time(),
+                    "fused_with": prompt_ids,
+                    "result": result,
                 }
-            )
+        return results
+
+    @staticmethod
+    def _below_threshold(prompt: PromptDefinition, confidence: float) -> bool:
+        return prompt.execution == "auto" and confidence < prompt.confidence_threshold
 
+    @staticmethod
+    def _deferred(
+        prompt: PromptDefinition, confidence: float, session_id: str
+    ) -> Dict[str, Any]:
         return {
-            "status": "completed",
+            "status": "deferred",
             "prompt_id": prompt.id,
-            "level": prompt.level,
+            "reason": f"Confidence {confidence:.2f} below threshold {prompt.confidence_threshold:.2f}",
             "session_id": session_id,
-            "governance_level": governance,
-            "result": result,
         }
+
+    def _record(
+        self,
+        prompt: PromptDefinition,
+        session_id: str,
+        confidence: float,
+        governance: str,
+        result: Dict[str, Any],
+    ) -> None:
+        # Persist prompt execution record
+        if self._persist is not None:
+            record = prompt.record_template.copy()
+            record["session_hash"] = session_id
+            record["confidence"] = confidence
+            record["governance_level"] = governance
+            record["result_summary"] = result.get("executive")
+            record["created_at"] = time.time()
+            self._persist(record)
@@ -13,23 +13,141 @@ aligned with AUTONOMOUS_PROMPTS.md levels. Each prompt has:
 
 from __future__ import annotations
 
+import sys
+from collections import ChainMap
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from vision_cortex.validators.safety import enforce_governance
 
 EXECUTION_MODES = ["manual", "assisted", "background", "auto"]
 
+# One shared tuple object per distinct agent/tag set across all prompts.
+_SHARED_TUPLES: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def _shared_tuple(values: Sequence[str]) -> Tuple[str, ...]:
+    interned = tuple(map(sys.intern, values))
+    return _SHARED_TUPLES.setdefault(interned, interned)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class PromptDefinition:
     id: str
     level: int
     description: str
     execution: str = "manual"
     confidence_threshold: float = 0.85
-    agents: List[str] = field(default_factory=list)
-    tags: List[str] = field(default_factory=list)
+    agents: Tuple[str, ...] = ()
+    tags: Tuple[str, ...] = ()
     governance_level: str = "HIGH"
-    parameters: Dict[str, Any] = field(default_factory=dict)
+    parameters: Dict[str, Any] = field(default_factory=dict, hash=False)
+    # governance_level after enforce_governance, resolved once per definition
+    resolved_governance: str = field(default="", init=False, repr=False, compare=False)
+    # Constant part of the executor's prompt_execution memory record
+    record_template: Dict[str, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Modes, governance levels, agent names and tags repeat across every
+        # prompt; keep one string object per distinct value. Sequences are
+        # stored as tuples so definitions stay immutable and hashable. Tags
+        # are lower-cased here so filters never have to.
+        setattr_ = object.__setattr__
+        setattr_(self, "id", sys.intern(self.id))
+        setattr_(self, "execution", sys.intern(self.execution))
+        setattr_(self, "governance_level", sys.intern(self.governance_level))
+        setattr_(self, "resolved_governance", enforce_governance(self.governance_level))
+        setattr_(
+            self,
+            "record_template",
+            {
+                "type": "prompt_execution",
+                "prompt_id": self.id,
+                "level": self.level,
+                "execution_mode": self.execution,
+                "session_hash": "",
+                "confidence": 0.0,
+                "governance_level": self.resolved_governance,
+                "result_summary": None,
+                "created_at": 0.0,
+            },
+        )
+        setattr_(self, "agents", _shared_tuple(self.agents))
+        setattr_(self, "tags", _shared_tuple([tag.lower() for tag in self.tags]))
+
+
+# (level -> prompts, lower-cased tag -> prompts), each in registry order
+PromptIndex = Tuple[
+    Dict[int, Tuple[PromptDefinition, ...]], Dict[str, Tuple[PromptDefinition, ...]]
+]
+
+
+def _index_prompts(prompts: Iterable[PromptDefinition]) -> PromptIndex:
+    by_level: Dict[int, List[PromptDefinition]] = {}
+    by_tag: Dict[str, List[PromptDefinition]] = {}
+    for prompt in prompts:
+        by_level.setdefault(prompt.level, []).append(prompt)
+        for tag in dict.fromkeys(prompt.tags):
+            by_tag.setdefault(tag, []).append(prompt)
+    return (
+        {level: tuple(group) for level, group in by_level.items()},
+        {tag: tuple(group) for tag, group in by_tag.items()},
+    )
+
+
+def _select_prompts(
+    registry: Mapping[str, PromptDefinition],
+    index: PromptIndex,
+    level: Optional[int],
+    tags: Sequence[str],
+) -> List[PromptDefinition]:
+    """Prompts matching ``level`` and every tag, answered from ``index``."""
+    by_level, by_tag = index
+    hits = [by_tag.get(tag.lower(), ()) for tag in tags]
+    if level is not None:
+        hits.append(by_level.get(level, ()))
+    if not hits:
+        return list(registry.values())
+    # Walk the smallest hit list and keep entries present in all the others;
+    # an unknown tag or level (empty hit list) answers immediately.
+    smallest, *others = sorted(hits, key=len)
+    if not others or not smallest:
+        return list(smallest)
+    keep = [frozenset(p.id for p in group) for group in others]
+    return [p for p in smallest if all(p.id in ids for ids in keep)]
+
+
+def _alias_map(
+    registry: Mapping[str, PromptDefinition], aliases: Dict[str, str]
+) -> Dict[str, Optional[PromptDefinition]]:
+    """Case-insensitive lookup table for prompt ids and aliases.
+
+    Keys are the lower-cased ids and aliases plus each id verbatim, so the
+    usual spellings resolve without allocating a lower-cased copy. Aliases
+    win over ids, and an alias whose target is missing resolves to None, as
+    with the previous alias-then-registry lookup.
+    """
+    resolved: Dict[str, Optional[PromptDefinition]] = {
+        prompt_id.lower(): prompt for prompt_id, prompt in registry.items()
+    }
+    for alias, canonical in aliases.items():
+        resolved[alias.lower()] = registry.get(canonical)
+    for prompt_id in registry:
+        resolved.setdefault(prompt_id, resolved[prompt_id.lower()])
+    return resolved
 
 
 # ---------------------------------------------------------
@@ -40,8 +158,8 @@ L1_SYSTEM_SCAN = PromptDefinition(
     level=1,
     description="Perform a comprehensive system health check: gateway, DB, services, logs, disk.",
     execution="manual",
-    agents=["crawler", "validator"],
-    tags=["health", "diagnostics"],
+    agents=("crawler", "validator"),
+    tags=("health", "diagnostics"),
     governance_level="LOW",
 )
 
@@ -50,8 +168,8 @@ L1_DATA_INGEST_REVIEW = PromptDefinition(
     level=1,
     description="Review pending data ingestion tasks: queue status, sync timestamps, data quality.",
     execution="manual",
-    agents=["ingestor", "organizer"],
-    tags=["ingest", "queue"],
+    agents=("ingestor", "organizer"),
+    tags=("ingest", "queue"),
     governance_level="LOW",
 )
 
@@ -63,8 +181,8 @@ L2_INTELLIGENCE_SYNTHESIS = PromptDefinition(
     level=2,
     description="Synthesize intelligence from available data; identify patterns and confidence levels.",
     execution="assisted",
-    agents=["crawler", "ingestor", "organizer", "visionary"],
-    tags=["intelligence", "synthesis"],
+    agents=("crawler", "ingestor", "organizer", "visionary"),
+    tags=("intelligence", "synthesis"),
     governance_level="MEDIUM",
 )
 
@@ -73,8 +191,8 @@ L2_MARKET_ANALYSIS = PromptDefinition(
     level=2,
     description="Analyze current market signals: macro, sentiment, consensus, sector, risk.",
     execution="assisted",
-    agents=["crawler", "predictor", "strategist"],
-    tags=["market", "analysis"],
+    agents=("crawler", "predictor", "strategist"),
+    tags=("market", "analysis"),
     governance_level="MEDIUM",
 )
 
@@ -86,8 +204,8 @@ L3_GENERATE_PREDICTIONS = PromptDefinition(
     level=3,
     description="Generate forward-looking predictions with confidence intervals; human review required.",
     execution="assisted",
-    agents=["predictor", "validator"],
-    tags=["prediction", "forecast"],
+    agents=("predictor", "validator"),
+    tags=("prediction", "forecast"),
     governance_level="HIGH",
     confidence_threshold=0.70,
 )
@@ -97,8 +215,8 @@ L3_SCENARIO_ANALYSIS = PromptDefinition(
     level=3,
     description="Run what-if scenarios with probability-weighted outcomes.",
     execution="assisted",
-    agents=["predictor", "strategist", "validator"],
-    tags=["scenario", "simulation"],
+    agents=("predictor", "strategist", "validator"),
+    tags=("scenario", "simulation"),
     governance_level="HIGH",
 )
 
@@ -110,8 +228,8 @@ L4_BUILD_STRATEGY = PromptDefinition(
     level=4,
     description="Construct multi-step strategy with objectives, execution plan, success metrics, risks.",
     execution="assisted",
-    agents=["strategist", "visionary", "ceo", "documentor"],
-    tags=["strategy", "planning"],
+    agents=("strategist", "visionary", "ceo", "documentor"),
+    tags=("strategy", "planning"),
     governance_level="HIGH",
 )
 
@@ -120,8 +238,8 @@ L4_PARALLEL_ANALYSIS = PromptDefinition(
     level=4,
     description="Execute multiple analyses in parallel: distress scoring, credit intel, macro synthesis.",
     execution="assisted",
-    agents=["crawler", "ingestor", "organizer", "predictor", "strategist"],
-    tags=["parallel", "analysis"],
+    agents=("crawler", "ingestor", "organizer", "predictor", "strategist"),
+    tags=("parallel", "analysis"),
     governance_level="HIGH",
 )
 
@@ -133,8 +251,8 @@ L5_GENERATE_ACTIONS = PromptDefinition(
     level=5,
     description="Generate concrete action steps with priorities, dependencies, and approval gates.",
     execution="assisted",
-    agents=["strategist", "ceo", "documentor"],
-    tags=["actions", "execution"],
+    agents=("strategist", "ceo", "documentor"),
+    tags=("actions", "execution"),
     governance_level="HIGH",
 )
 
@@ -146,8 +264,8 @@ L6_SCHEDULED_INTELLIGENCE = PromptDefinition(
     level=6,
     description="Continuous background intelligence: hourly ingest, rolling predictions, anomaly detection.",
     execution="background",
-    agents=["crawler", "ingestor", "predictor", "validator"],
-    tags=["scheduled", "background"],
+    agents=("crawler", "ingestor", "predictor", "validator"),
+    tags=("scheduled", "background"),
     governance_level="MEDIUM",
 )
 
@@ -156,8 +274,8 @@ L6_LEDGER_UPDATES = PromptDefinition(
     level=6,
     description="Continuously update decision ledgers: append decisions, scores, sources, audit trail.",
     execution="background",
-    agents=["documentor", "validator"],
-    tags=["ledger", "audit"],
+    agents=("documentor", "validator"),
+    tags=("ledger", "audit"),
     governance_level="MEDIUM",
 )
 
@@ -169,7 +287,7 @@ L7_DAG_EXECUTION = PromptDefinition(
     level=7,
     description="Execute DAG-based workflows: parallelize independent tasks, handle dependencies, retries.",
     execution="background",
-    agents=[
+    agents=(
         "crawler",
         "ingestor",
         "organizer",
@@ -177,8 +295,8 @@ L7_DAG_EXECUTION = PromptDefinition(
         "strategist",
         "validator",
         "documentor",
-    ],
-    tags=["dag", "orchestration"],
+    ),
+    tags=("dag", "orchestration"),
     governance_level="HIGH",
 )
 
@@ -187,8 +305,8 @@ L7_ADAPTIVE_RESOURCE_ALLOCATION = PromptDefinition(
     level=7,
     description="Dynamically allocate compute: monitor queue, spin workers, balance load.",
     execution="background",
-    agents=["evolver"],
-    tags=["resources", "scaling"],
+    agents=("evolver",),
+    tags=("resources", "scaling"),
     governance_level="HIGH",
 )
 
@@ -200,8 +318,8 @@ L8_DETECT_SCALING_PRESSURE = PromptDefinition(
     level=8,
     description="Monitor system for scaling constraints: latency, queue depth, utilization, bottlenecks.",
     execution="background",
-    agents=["evolver", "validator"],
-    tags=["scaling", "optimization"],
+    agents=("evolver", "validator"),
+    tags=("scaling", "optimization"),
     governance_level="HIGH",
 )
 
@@ -210,8 +328,8 @@ L8_MODULARIZE_ARCHITECTURE = PromptDefinition(
     level=8,
     description="Auto-refactor architecture: identify coupling, propose module boundaries, refactoring plan.",
     execution="assisted",
-    agents=["evolver", "documentor", "ceo"],
-    tags=["architecture", "refactor"],
+    agents=("evolver", "documentor", "ceo"),
+    tags=("architecture", "refactor"),
     governance_level="CRITICAL",
 )
 
@@ -224,8 +342,8 @@ L9_AUTO_PREDICT = PromptDefinition(
     description="Autonomous prediction: execute if confidence >85%, flag 70-85%, simulate <70%.",
     execution="auto",
     confidence_threshold=0.85,
-    agents=["predictor", "validator", "ceo"],
-    tags=["auto", "prediction"],
+    agents=("predictor", "validator", "ceo"),
+    tags=("auto", "prediction"),
     governance_level="CRITICAL",
 )
 
@@ -235,8 +353,8 @@ L9_PAPER_TRADING = PromptDefinition(
     description="Execute paper trading strategies: generate signals, virtual trades, track performance.",
     execution="auto",
     confidence_threshold=0.75,
-    agents=["predictor", "strategist", "validator"],
-    tags=["paper", "trading"],
+    agents=("predictor", "strategist", "validator"),
+    tags=("paper", "trading"),
     governance_level="HIGH",
 )
 
@@ -249,8 +367,8 @@ L10_CONTINUOUS_IMPROVEMENT = PromptDefinition(
     description="System self-improvement: track accuracy, propose upgrades, sandbox test, staged deploy.",
     execution="auto",
     confidence_threshold=0.90,
-    agents=["evolver", "validator", "documentor", "ceo"],
-    tags=["meta", "improvement"],
+    agents=("evolver", "validator", "documentor", "ceo"),
+    tags=("meta", "improvement"),
     governance_level="CRITICAL",
 )
 
@@ -260,50 +378,72 @@ L10_CONFIDENCE_ESCALATION = PromptDefinition(
     description="Handle uncertainty through escalation: high→execute, medium→review, low→human decision.",
     execution="auto",
     confidence_threshold=0.85,
-    agents=["ceo", "validator"],
-    tags=["escalation", "confidence"],
+    agents=("ceo", "validator"),
+    tags=("escalation", "confidence"),
     governance_level="CRITICAL",
 )
 
 # ---------------------------------------------------------
 # Registry / Alias System
 # ---------------------------------------------------------
-# Core L1-L10 system prompts
-CORE_PROMPT_REGISTRY: Dict[str, PromptDefinition] = {
-    "L1_SYSTEM_SCAN": L1_SYSTEM_SCAN,
-    "L1_DATA_INGEST_REVIEW": L1_DATA_INGEST_REVIEW,
-    "L2_INTELLIGENCE_SYNTHESIS": L2_INTELLIGENCE_SYNTHESIS,
-    "L2_MARKET_ANALYSIS": L2_MARKET_ANALYSIS,
-    "L3_GENERATE_PREDICTIONS": L3_GENERATE_PREDICTIONS,
-    "L3_SCENARIO_ANALYSIS": L3_SCENARIO_ANALYSIS,
-    "L4_BUILD_STRATEGY": L4_BUILD_STRATEGY,
-    "L4_PARALLEL_ANALYSIS": L4_PARALLEL_ANALYSIS,
-    "L5_GENERATE_ACTIONS": L5_GENERATE_ACTIONS,
-    "L6_SCHEDULED_INTELLIGENCE": L6_SCHEDULED_INTELLIGENCE,
-    "L6_LEDGER_UPDATES": L6_LEDGER_UPDATES,
-    "L7_DAG_EXECUTION": L7_DAG_EXECUTION,
-    "L7_ADAPTIVE_RESOURCE_ALLOCATION": L7_ADAPTIVE_RESOURCE_ALLOCATION,
-    "L8_DETECT_SCALING_PRESSURE": L8_DETECT_SCALING_PRESSURE,
-    "L8_MODULARIZE_ARCHITECTURE": L8_MODULARIZE_ARCHITECTURE,
-    "L9_AUTO_PREDICT": L9_AUTO_PREDICT,
-    "L9_PAPER_TRADING": L9_PAPER_TRADING,
-    "L10_CONTINUOUS_IMPROVEMENT": L10_CONTINUOUS_IMPROVEMENT,
-    "L10_CONFIDENCE_ESCALATION": L10_CONFIDENCE_ESCALATION,
-}
+# Core L1-L10 system prompts. Registries are read-only views: the cached
+# indexes, resolve maps and list results above assume they never change.
+CORE_PROMPT_REGISTRY: Mapping[str, PromptDefinition] = MappingProxyType(
+    {
+        "L1_SYSTEM_SCAN": L1_SYSTEM_SCAN,
+        "L1_DATA_INGEST_REVIEW": L1_DATA_INGEST_REVIEW,
+        "L2_INTELLIGENCE_SYNTHESIS": L2_INTELLIGENCE_SYNTHESIS,
+        "L2_MARKET_ANALYSIS": L2_MARKET_ANALYSIS,
+        "L3_GENERATE_PREDICTIONS": L3_GENERATE_PREDICTIONS,
+        "L3_SCENARIO_ANALYSIS": L3_SCENARIO_ANALYSIS,
+        "L4_BUILD_STRATEGY": L4_BUILD_STRATEGY,
+        "L4_PARALLEL_ANALYSIS": L4_PARALLEL_ANALYSIS,
+        "L5_GENERATE_ACTIONS": L5_GENERATE_ACTIONS,
+        "L6_SCHEDULED_INTELLIGENCE": L6_SCHEDULED_INTELLIGENCE,
+        "L6_LEDGER_UPDATES": L6_LEDGER_UPDATES,
+        "L7_DAG_EXECUTION": L7_DAG_EXECUTION,
+        "L7_ADAPTIVE_RESOURCE_ALLOCATION": L7_ADAPTIVE_RESOURCE_ALLOCATION,
+        "L8_DETECT_SCALING_PRESSURE": L8_DETECT_SCALING_PRESSURE,
+        "L8_MODULARIZE_ARCHITECTURE": L8_MODULARIZE_ARCHITECTURE,
+        "L9_AUTO_PREDICT": L9_AUTO_PREDICT,
+        "L9_PAPER_TRADING": L9_PAPER_TRADING,
+        "L10_CONTINUOUS_IMPROVEMENT": L10_CONTINUOUS_IMPROVEMENT,
+        "L10_CONFIDENCE_ESCALATION": L10_CONFIDENCE_ESCALATION,
+    }
+)
 
-# Import domain prompts and merge
+# Domain prompts are merged lazily: the domain module only builds its
+# PromptDefinitions when PROMPT_REGISTRY is first used.
 try:
-    from .domain_registry import DOMAIN_ALIASES, DOMAIN_PROMPT_REGISTRY
+    from . import domain_registry as _domain
+    from .domain_registry import DOMAIN_ALIASES
 
-    PROMPT_REGISTRY: Dict[str, PromptDefinition] = {
-        **CORE_PROMPT_REGISTRY,
-        **DOMAIN_PROMPT_REGISTRY,
-    }
+    HAS_DOMAIN_PROMPTS = True
 except ImportError:
     # Fallback if domain_registry not available
-    PROMPT_REGISTRY: Dict[str, PromptDefinition] = CORE_PROMPT_REGISTRY
+    HAS_DOMAIN_PROMPTS = False
     DOMAIN_ALIASES: Dict[str, str] = {}
 
+
+@lru_cache(maxsize=None)
+def _prompt_registry() -> Mapping[str, PromptDefinition]:
+    if not HAS_DOMAIN_PROMPTS:
+        return CORE_PROMPT_REGISTRY
+    # A view over both registries rather than a merged copy. Domain entries
+    # shadow core ones, and iteration yields core prompts first, as a
+    # {**core, **domain} merge would.
+    return MappingProxyType(
+        ChainMap(_domain.DOMAIN_PROMPT_REGISTRY, CORE_PROMPT_REGISTRY)
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Build PROMPT_REGISTRY on first access (PEP 562)."""
+    if name == "PROMPT_REGISTRY":
+        return _prompt_registry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Short aliases for convenience (core L1-L10 + domain aliases)
 CORE_ALIASES: Dict[str, str] = {
     "scan": "L1_SYSTEM_SCAN",
@@ -331,19 +471,50 @@ CORE_ALIASES: Dict[str, str] = {
 ALIASES: Dict[str, str] = {**CORE_ALIASES, **DOMAIN_ALIASES}
 
 
+@lru_cache(maxsize=256)
 def resolve_alias(name: str) -> Optional[PromptDefinition]:
-    """Resolve alias or direct ID to PromptDefinition."""
-    canonical = ALIASES.get(name.lower(), name.upper())
-    return PROMPT_REGISTRY.get(canonical)
+    """Resolve alias or direct ID to PromptDefinition.
+
+    Memoised: ALIASES and PROMPT_REGISTRY are fixed after import, and
+    PromptDefinitions are immutable. Names the domain registry does not
+    claim resolve against the core prompts alone, so core lookups never
+    build the domain PromptDefinitions.
+    """
+    if HAS_DOMAIN_PROMPTS and _domain.is_domain_name(name):
+        resolved = _resolve_map()
+    else:
+        resolved = _core_resolve_map()
+    return resolved.get(name) or resolved.get(name.lower())
+
+
+@lru_cache(maxsize=None)
+def _resolve_map() -> Dict[str, Optional[PromptDefinition]]:
+    return _alias_map(_prompt_registry(), ALIASES)
+
+
+@lru_cache(maxsize=None)
+def _core_resolve_map() -> Dict[str, Optional[PromptDefinition]]:
+    return _alias_map(CORE_PROMPT_REGISTRY, CORE_ALIASES)
 
 
 def list_prompts(
     level: Optional[int] = None, tag: Optional[str] = None
 ) -> List[PromptDefinition]:
     """List prompts, optionally filtering by level or tag."""
-    results = list(PROMPT_REGISTRY.values())
-    if level is not None:
-        results = [p for p in results if p.level == level]
-    if tag:
-        results = [p for p in results if tag.lower() in (t.lower() for t in p.tags)]
-    return results
+    return list(_list_prompts(level, tag))
+
+
+@lru_cache(maxsize=128)
+def _list_prompts(
+    level: Optional[int], tag: Optional[str]
+) -> Tuple[PromptDefinition, ...]:
+    return tuple(
+        _select_prompts(
+            _prompt_registry(), _prompt_indexes(), level, (tag,) if tag else ()
+        )
+    )
+
+
+@lru_cache(maxsize=None)
+def _prompt_indexes() -> PromptIndex:
+    return _index_prompts(_prompt_registry().values())
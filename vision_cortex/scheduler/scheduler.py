@@ -5,12 +5,28 @@ Governed by: /mcp/contracts/OPERATIONAL_SCHEDULE.json
 Manages scheduled events and task execution for Vision Cortex agents.
 """
 
+import calendar
 import json
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(payload: Dict[str, Any]) -> bytes:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(payload: Dict[str, Any]) -> bytes:
+        return json.dumps(payload).encode()
 
 
 class Frequency(Enum):
@@ -43,7 +59,45 @@ class TaskPriority(Enum):
     CRITICAL = 4
 
 
-@dataclass
+# Config value -> enum member, built once; Enum.__call__ is slow per row.
+_FREQ_BY_VALUE = {f.value: f for f in Frequency}
+_STATUS_BY_VALUE = {s.value: s for s in TaskStatus}
+_PRIO_BY_NAME = {p.name.lower(): p for p in TaskPriority}
+
+_MINUTE = timedelta(minutes=1)
+# Minimum time since last_run before an event may fire again.
+_RERUN_GAP = {
+    Frequency.DAILY: timedelta(hours=23),
+    Frequency.WEEKLY: timedelta(days=6),
+    Frequency.MONTHLY: timedelta(days=27),
+}
+_WEEKDAY = {
+    "Monday": 0,
+    "Tuesday": 1,
+    "Wednesday": 2,
+    "Thursday": 3,
+    "Friday": 4,
+    "Saturday": 5,
+    "Sunday": 6,
+}
+
+
+def _parse_time(value: str) -> Tuple[int, int]:
+    """Parse an ``"HH:MM UTC"`` event time into ``(hour, minute)``."""
+    hour, minute = map(int, value.replace(" UTC", "").split(":"))
+    return hour, minute
+
+
+@lru_cache(maxsize=8)
+def _read_config(path: Path, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a schedule file; keyed on mtime so edits invalidate the entry.
+
+    The result is shared between callers and must be treated as read-only.
+    """
+    return _loads(path.read_bytes())
+
+
+@dataclass(slots=True)
 class ScheduledEvent:
     """A scheduled calendar event."""
 
@@ -60,6 +114,12 @@ class ScheduledEvent:
     day: Optional[str] = None  # For weekly/monthly
     last_run: Optional[datetime] = None
     next_run: Optional[datetime] = None
+    # Parsed from ``time`` once; due checks run every tick.
+    _hour: int = field(default=0, init=False, repr=False, compare=False)
+    _minute: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._hour, self._minute = _parse_time(self.time)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -79,7 +139,7 @@ class ScheduledEvent:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """A task item."""
 
@@ -107,7 +167,7 @@ class Task:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskList:
     """A collection of related tasks."""
 
@@ -115,20 +175,81 @@ class TaskList:
     name: str
     owner: str
     tasks: List[Task] = field(default_factory=list)
+    _dict_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _dirty: bool = field(default=True, init=False, repr=False, compare=False)
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "list_id": self.list_id,
-            "name": self.name,
-            "owner": self.owner,
-            "tasks": [t.to_dict() for t in self.tasks],
-        }
+        """Serialized form, reused until the list is marked dirty.
+
+        Scheduler.update_task_status marks the list dirty; call mark_dirty()
+        after changing ``tasks`` directly. Treat the result as read-only.
+        """
+        if self._dirty or self._dict_cache is None:
+            self._dict_cache = {
+                "list_id": self.list_id,
+                "name": self.name,
+                "owner": self.owner,
+                "tasks": [t.to_dict() for t in self.tasks],
+            }
+            self._dirty = False
+        return self._dict_cache
 
-    def get_pending(self) -> List[Task]:
-        return [t for t in self.tasks if t.status == TaskStatus.PENDING]
+    def mark_dirty(self) -> None:
+        self._dirty = True
 
-    def get_completed(self) -> List[Task]:
-        return [t for t in self.tasks if t.status == TaskStatus.COMPLETED]
+    def get_pending(self) -> Iterator[Task]:
+        return (t for t in self.tasks if t.status is TaskStatus.PENDING)
+
+    def get_completed(self) -> Iterator[Task]:
+        return (t for t in self.tasks if t.status is TaskStatus.COMPLETED)
+
+
+class _CalendarQueue:
+    """Calendar queue (timing wheel) of one-minute buckets spanning a day.
+
+    Slots are whole minutes, so an entry's bucket is its minute of day and
+    insertion is O(1). Draining visits only the buckets between the last
+    drained minute and now, at most one full revolution after a long gap.
+    Entries are ``(slot, seq, event_id)``; ``seq`` breaks ties between
+    events sharing a slot so they always come out in a fixed order.
+    """
+
+    BUCKETS = 24 * 60
+
+    def __init__(self) -> None:
+        self._buckets: List[List[Tuple[datetime, int, str]]] = [
+            [] for _ in range(self.BUCKETS)
+        ]
+        self.cursor = datetime.min  # last minute drained
+
+    def reset(self, start: datetime) -> None:
+        """Empty the wheel; the next drain starts with ``start``'s bucket."""
+        for bucket in self._buckets:
+            bucket.clear()
+        self.cursor = start - _MINUTE
+
+    def push(self, slot: datetime, seq: int, event_id: str) -> None:
+        self._buckets[slot.hour * 60 + slot.minute].append((slot, seq, event_id))
+
+    def drain(self, minute: datetime) -> List[Tuple[datetime, int, str]]:
+        """Remove and return entries with slots at or before ``minute``, in order."""
+        steps = min((minute - self.cursor) // _MINUTE, self.BUCKETS)
+        index = self.cursor.hour * 60 + self.cursor.minute
+        buckets = self._buckets
+        reached: List[Tuple[datetime, int, str]] = []
+        for _ in range(steps):
+            index = (index + 1) % self.BUCKETS
+            bucket = buckets[index]
+            if bucket:
+                keep = [entry for entry in bucket if entry[0] > minute]
+                if len(keep) != len(bucket):
+                    reached.extend(entry for entry in bucket if entry[0] <= minute)
+                    buckets[index] = keep
+        self.cursor = minute
+        reached.sort()
+        return reached
 
 
 class Scheduler:
@@ -146,15 +267,24 @@ class Scheduler:
         self.config_path = Path(config_path)
         self._events: Dict[str, ScheduledEvent] = {}
         self._task_lists: Dict[str, TaskList] = {}
+        self._task_index: Dict[Tuple[str, str], Task] = {}
+        # Maintained by load_config/update_task_status so get_status is O(1).
+        self._total_tasks = 0
+        self._completed_tasks = 0
         self._event_handlers: Dict[str, Callable] = {}
+        # Next-run slots of recurring events, plus the minute last polled;
+        # rebuilt if polled out of order.
+        self._calendar = _CalendarQueue()
+        self._polled_minute: Optional[datetime] = None
 
     def load_config(self) -> bool:
         """Load schedule configuration from JSON."""
-        if not self.config_path.exists():
+        try:
+            mtime_ns = self.config_path.stat().st_mtime_ns
+        except FileNotFoundError:
             return False
 
-        with open(self.config_path, "r") as f:
-            config = json.load(f)
+        config = _read_config(self.config_path, mtime_ns)
 
         # Load events
         for event_data in config.get("scheduling", {}).get("calendar_events", []):
@@ -162,11 +292,11 @@ class Scheduler:
                 event_id=event_data["event_id"],
                 name=event_data["name"],
                 description=event_data["description"],
-                frequency=Frequency(event_data["frequency"]),
+                frequency=_FREQ_BY_VALUE[event_data["frequency"]],
                 time=event_data["time"],
                 duration_minutes=event_data["duration_minutes"],
                 responsible_agent=event_data["responsible_agent"],
-                pipeline=event_data.get("pipeline", []),
+                pipeline=list(event_data.get("pipeline", ())),
                 governance_level=event_data.get("governance_level", "MEDIUM"),
                 requires_human_approval=event_data.get(
                     "requires_human_approval", False
@@ -176,16 +306,17 @@ class Scheduler:
             self._events[event.event_id] = event
 
         # Load task lists
+        status_of, priority_of = _STATUS_BY_VALUE, _PRIO_BY_NAME
         for list_data in config.get("tasks", {}).get("google_task_lists", []):
-            tasks = []
-            for task_data in list_data.get("tasks", []):
-                task = Task(
-                    task_id=task_data["task_id"],
-                    title=task_data["title"],
-                    status=TaskStatus(task_data.get("status", "pending")),
-                    priority=TaskPriority[task_data.get("priority", "medium").upper()],
+            tasks = [
+                Task(
+                    task_data["task_id"],
+                    task_data["title"],
+                    status_of[task_data.get("status", "pending")],
+                    priority_of[task_data.get("priority", "medium").lower()],
                 )
-                tasks.append(task)
+                for task_data in list_data.get("tasks", ())
+            ]
 
             task_list = TaskList(
                 list_id=list_data["list_id"],
@@ -195,59 +326,104 @@ class Scheduler:
             )
             self._task_lists[task_list.list_id] = task_list
 
+        self._task_index = {
+            (list_id, task.task_id): task
+            for list_id, task_list in self._task_lists.items()
+            for task in task_list.tasks
+        }
+        self._total_tasks = sum(len(tl.tasks) for tl in self._task_lists.values())
+        self._completed_tasks = sum(
+            t.status is TaskStatus.COMPLETED
+            for tl in self._task_lists.values()
+            for t in tl.tasks
+        )
+        self._schedule_from(datetime.utcnow())
         return True
 
     def get_due_events(self, now: Optional[datetime] = None) -> List[ScheduledEvent]:
-        """Get events that are due to run."""
+        """Get events that are due to run.
+
+        Only events whose next firing slot has been reached are examined, each
+        slot is reported at most once, and a slot whose minute has already
+        passed is skipped rather than fired late.
+        """
         if now is None:
             now = datetime.utcnow()
 
+        minute = now.replace(second=0, microsecond=0)
+        if self._polled_minute is None or minute < self._polled_minute:
+            self._schedule_from(minute)
+        self._polled_minute = minute
+
         due = []
-        for event in self._events.values():
-            if self._is_event_due(event, now):
-                due.append(event)
+        wheel = self._calendar
+        for slot, seq, event_id in wheel.drain(minute):
+            event = self._events[event_id]
+            if slot < minute:  # missed while not polled
+                slot = self._next_run(event, minute)
+            if slot == minute:
+                if self._is_event_due(event, now):
+                    due.append(event)
+                slot = self._next_run(event, minute + _MINUTE)
+            event.next_run = slot
+            if slot is not None:
+                wheel.push(slot, seq, event_id)
 
         return due
 
-    def _is_event_due(self, event: ScheduledEvent, now: datetime) -> bool:
-        """Check if an event is due to run."""
-        # Parse event time
-        hour, minute = map(int, event.time.replace(" UTC", "").split(":"))
-
-        # Check frequency
-        if event.frequency == Frequency.DAILY:
-            if now.hour == hour and now.minute == minute:
-                if event.last_run is None or (now - event.last_run) > timedelta(
-                    hours=23
-                ):
-                    return True
-
-        elif event.frequency == Frequency.WEEKLY:
-            day_map = {
-                "Monday": 0,
-                "Tuesday": 1,
-                "Wednesday": 2,
-                "Thursday": 3,
-                "Friday": 4,
-                "Saturday": 5,
-                "Sunday": 6,
-            }
-            if event.day and now.weekday() == day_map.get(event.day, -1):
-                if now.hour == hour and now.minute == minute:
-                    if event.last_run is None or (now - event.last_run) > timedelta(
-                        days=6
-                    ):
-                        return True
-
-        elif event.frequency == Frequency.MONTHLY:
-            if event.day and now.day == int(event.day):
-                if now.hour == hour and now.minute == minute:
-                    if event.last_run is None or (now - event.last_run) > timedelta(
-                        days=27
-                    ):
-                        return True
-
-        return False
+    def _schedule_from(self, start: datetime) -> None:
+        """Rebuild the calendar with each event's first slot at/after start."""
+        start = start.replace(second=0, microsecond=0)
+        self._calendar.reset(start)
+        # Load order is the tiebreak for events due in the same minute.
+        for seq, event in enumerate(self._events.values()):
+            event.next_run = self._next_run(event, start)
+            if event.next_run is not None:
+                self._calendar.push(event.next_run, seq, event.event_id)
+        self._polled_minute = start
+
+    @staticmethod
+    def _next_run(event: ScheduledEvent, start: datetime) -> Optional[datetime]:
+        """First firing slot for ``event`` at or after ``start`` (whole minute)."""
+        slot = start.replace(hour=event._hour, minute=event._minute)
+
+        if event.frequency is Frequency.DAILY:
+            return slot if slot >= start else slot + timedelta(days=1)
+
+        if event.frequency is Frequency.WEEKLY:
+            weekday = _WEEKDAY.get(event.day) if event.day else None
+            if weekday is None:
+                return None
+            slot += timedelta(days=(weekday - slot.weekday()) % 7)
+            return slot if slot >= start else slot + timedelta(days=7)
+
+        if event.frequency is Frequency.MONTHLY:
+            if not event.day:
+                return None
+            day = int(event.day)
+            if not 1 <= day <= 31:
+                return None
+            year, month = start.year, start.month
+            while True:
+                if day <= calendar.monthrange(year, month)[1]:
+                    slot = slot.replace(year=year, month=month, day=day)
+                    if slot >= start:
+                        return slot
+                year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+        return None
+
+    @staticmethod
+    def _is_event_due(event: ScheduledEvent, now: datetime) -> bool:
+        """Check if an event reaching its slot may run (re-run guard).
+
+        The calendar slot already fixes the weekday, day of month, hour and
+        minute, so only the time since ``last_run`` is left to check.
+        """
+        gap = _RERUN_GAP.get(event.frequency)
+        if gap is None:
+            return False
+        return event.last_run is None or (now - event.last_run) > gap
 
     def mark_event_run(self, event_id: str) -> None:
         """Mark an event as having run."""
@@ -280,32 +456,45 @@ class Scheduler:
         self, list_id: str, task_id: str, status: TaskStatus
     ) -> bool:
         """Update task status."""
-        task_list = self._task_lists.get(list_id)
-        if not task_list:
-            return False
-
-        for task in task_list.tasks:
-            if task.task_id == task_id:
-                task.status = status
-                if status == TaskStatus.COMPLETED:
-                    task.completed_at = datetime.utcnow()
-                return True
-
-        return False
+        task = self._task_index.get((list_id, task_id))
+        if task is None:
+            # Tasks appended to a TaskList after load_config are not indexed.
+            task_list = self._task_lists.get(list_id)
+            if not task_list:
+                return False
+            task = next((t for t in task_list.tasks if t.task_id == task_id), None)
+            if task is None:
+                return False
+            self._task_index[(list_id, task_id)] = task
+            self._total_tasks += 1
+            self._completed_tasks += task.status is TaskStatus.COMPLETED
+
+        self._completed_tasks += (status is TaskStatus.COMPLETED) - (
+            task.status is TaskStatus.COMPLETED
+        )
+        task.status = status
+        if status is TaskStatus.COMPLETED:
+            task.completed_at = datetime.utcnow()
+        self._task_lists[list_id].mark_dirty()
+        return True
 
     def get_all_pending_tasks(self) -> List[Task]:
         """Get all pending tasks across all lists."""
-        pending = []
-        for task_list in self._task_lists.values():
-            pending.extend(task_list.get_pending())
-        return pending
+        return [
+            t
+            for tl in self._task_lists.values()
+            for t in tl.tasks
+            if t.status is TaskStatus.PENDING
+        ]
 
     def get_status(self) -> Dict[str, Any]:
-        """Get scheduler status."""
-        total_tasks = sum(len(tl.tasks) for tl in self._task_lists.values())
-        completed_tasks = sum(
-            len(tl.get_completed()) for tl in self._task_lists.values()
-        )
+        """Get scheduler status.
+
+        Task counts track changes made through load_config and
+        update_task_status.
+        """
+        total_tasks = self._total_tasks
+        completed_tasks = self._completed_tasks
 
         return {
             "events_count": len(self._events),
@@ -323,3 +512,7 @@ class Scheduler:
             "task_lists": [tl.to_dict() for tl in self._task_lists.values()],
             "status": self.get_status(),
         }
+
+    def export_schedule_bytes(self) -> bytes:
+        """Export current schedule state as serialized JSON."""
+        return _dumps(self.export_schedule())
@@ -22,7 +22,12 @@ def _id() -> str:
     return str(uuid.uuid4())
 
 
-@dataclass
+def _as_dict(self: Any) -> Dict[str, Any]:
+    """Shallow field mapping for payloads (slots leave no ``__dict__``)."""
+    return {name: getattr(self, name) for name in self.__slots__}
+
+
+@dataclass(slots=True)
 class Message:
     topic: str
     content: Dict[str, Any]
@@ -33,8 +38,10 @@ class Message:
     sender: Optional[str] = None
     timestamp: float = field(default_factory=_now)
 
+    as_dict = _as_dict
+
 
-@dataclass
+@dataclass(slots=True)
 class DebateTurn:
     role: str
     agent: str
@@ -49,8 +56,10 @@ class DebateTurn:
         if self.tag not in REASONING_TAGS:
             self.tag = "UNCERTAIN"
 
+    as_dict = _as_dict
 
-@dataclass
+
+@dataclass(slots=True)
 class DebateResult:
     topic: str
     turns: List[DebateTurn]
@@ -59,15 +68,19 @@ class DebateResult:
     dissenting: List[DebateTurn]
     metrics: Dict[str, Any]
 
+    as_dict = _as_dict
+
 
-@dataclass
+@dataclass(slots=True)
 class ConfidenceSignal:
     score: float
     rationale: str
     tag: str = "UNCERTAIN"
 
+    as_dict = _as_dict
 
-@dataclass
+
+@dataclass(slots=True)
 class Observation:
     title: str
     text: str
@@ -76,8 +89,10 @@ class Observation:
     tags: List[str] = field(default_factory=list)
     confidence: float = 0.5
 
+    as_dict = _as_dict
+
 
-@dataclass
+@dataclass(slots=True)
 class Prediction:
     statement: str
     horizon_days: int
@@ -85,19 +100,25 @@ class Prediction:
     tag: str
     signals: List[str] = field(default_factory=list)
 
+    as_dict = _as_dict
+
 
-@dataclass
+@dataclass(slots=True)
 class PlanStep:
     timeframe: str
     actions: List[str]
     risk: str
     success_metric: str
 
+    as_dict = _as_dict
 
-@dataclass
+
+@dataclass(slots=True)
 class PrioritizedAction:
     title: str
     priority: int
     confidence: float
     rationale: str
     governance_level: str
+
+    as_dict = _as_dict
@@ -0,0 +1,177 @@
+"""Tests for Vision Cortex agent, communication and memory contracts."""
+
+from datetime import datetime
+
+from vision_cortex.contracts import memory_contract
+from vision_cortex.contracts.agent_contract import AgentContract
+from vision_cortex.contracts.communication_contract import (
+    ChannelType,
+    CommunicationContract,
+    MessageSchema,
+)
+from vision_cortex.contracts.memory_contract import (
+    MemoryContract,
+    MemorySchema,
+    MemoryType,
+)
+from vision_cortex.schemas.contracts import Prediction
+
+
+def test_message_id_is_deterministic_64_bit():
+    kwargs = dict(
+        message_id="",
+        channel=ChannelType.DEBATE_ARENA,
+        sender_id="predictor_01",
+        payload={"x": 1},
+    )
+    first = MessageSchema(**kwargs)
+    second = MessageSchema(**kwargs, timestamp=first.timestamp)
+    assert len(first.message_id) == 16
+    int(first.message_id, 16)
+    assert first.message_id == second.message_id
+
+
+def test_batch_shares_precomputed_timestamp():
+    now = datetime(2023, 11, 14, 22, 13, 20)
+    batch = [
+        MessageSchema(
+            message_id="",
+            channel=ChannelType.BROADCAST,
+            sender_id=f"ceo_{i}",
+            payload={"i": i},
+            timestamp=now,
+        )
+        for i in range(3)
+    ]
+    assert {m.timestamp for m in batch} == {now}
+    assert batch[0].to_dict()["timestamp"] == "2023-11-14T22:13:20"
+
+
+def test_can_send_grants_only_listed_and_own_channels():
+    can_send = CommunicationContract.can_send
+    assert can_send("predictor_01", "debate.arena")
+    assert can_send("ceo_01", "system.broadcast")
+    assert can_send("crawler_01", "agent.crawler_01.output")
+    assert can_send("crawler", "agent.crawler.output")
+    assert not can_send("crawler_01", "debate.arena")
+    assert not can_send("crawler_01", "agent.crawler.output")
+    assert not can_send("crawler_01", "agent.ceo.output")
+    assert not can_send("crawler_01", "unknown.channel")
+
+
+def test_contract_dataclasses_use_slots():
+    msg = MessageSchema(
+        message_id="m1",
+        channel=ChannelType.BROADCAST,
+        sender_id="ceo_01",
+        payload={"ok": True},
+    )
+    assert not hasattr(msg, "__dict__")
+
+
+def test_released_message_is_reused_from_pool():
+    first = MessageSchema.acquire(
+        channel=ChannelType.BROADCAST, sender_id="ceo_01", payload={"a": 1}
+    )
+    first.release()
+    assert first.payload == {}
+
+    second = MessageSchema.acquire(
+        channel=ChannelType.CONSENSUS, sender_id="validator_01", payload={"b": 2}
+    )
+    assert second is first
+    assert second.channel is ChannelType.CONSENSUS
+    assert second.payload == {"b": 2}
+    assert len(second.message_id) == 16
+
+
+def test_validate_implementation_is_cached_per_class():
+    class Partial:
+        def run_task(self, context, payload):
+            return payload
+
+    first = AgentContract.validate_implementation(Partial)
+    assert first == [
+        "Missing required method: validate_input",
+        "Missing required method: emit_intent",
+    ]
+    first.clear()
+    assert len(AgentContract.validate_implementation(Partial)) == 2
+    assert Partial in AgentContract._validated
+
+
+def _memory_entry(**overrides) -> MemorySchema:
+    fields = dict(
+        session_hash="sess-1",
+        type=MemoryType.PREDICTION,
+        content={"p": 1},
+        confidence=0.8,
+        sources=[],
+        agent_id="predictor_01",
+        created_at=datetime(2025, 1, 1),
+    )
+    fields.update(overrides)
+    return MemorySchema(**fields)
+
+
+def test_memory_doc_id_fast_hash_flag(monkeypatch):
+    legacy = _memory_entry().doc_id
+    monkeypatch.setattr(memory_contract, "MEMORY_FAST_HASH", True)
+    fast = _memory_entry().doc_id
+    assert len(legacy) == len(fast) == 16
+    assert legacy != fast
+
+
+def test_memory_schema_caches_doc_id_and_firestore_doc():
+    entry = _memory_entry()
+    assert entry.doc_id is entry.doc_id
+    doc = entry.to_firestore_doc()
+    assert doc is entry.to_firestore_doc()
+    assert doc["type"] == "prediction"
+    assert doc["created_at"] == "2025-01-01T00:00:00"
+
+
+def test_memory_permissions_resolve_by_role():
+    entry = _memory_entry(type=MemoryType.INFERENCE, agent_id="strategist_01")
+    assert MemoryContract.can_read("ceo_01", entry)
+    assert MemoryContract.can_read("strategist_01", entry)
+    assert not MemoryContract.can_read("crawler_01", entry)
+    assert MemoryContract.can_write("crawler_01", MemoryType.SIGNAL)
+    assert not MemoryContract.can_write("crawler_01", MemoryType.PREDICTION)
+    assert MemoryContract.can_write("crawler_01", MemoryType.AUDIT_LOG)
+
+
+def test_memory_schema_is_slotted_and_interns_ids():
+    a = _memory_entry(agent_id="".join(["predictor", "_01"]))
+    b = _memory_entry(agent_id="".join(["predictor", "_01"]))
+    assert not hasattr(a, "__dict__")
+    assert a.agent_id is b.agent_id
+
+
+def test_memory_doc_id_v2_is_time_prefixed(monkeypatch):
+    monkeypatch.setattr(memory_contract, "DOC_ID_SCHEME", "v2")
+    early = _memory_entry(created_at=datetime(2025, 1, 1)).doc_id
+    late = _memory_entry(created_at=datetime(2025, 1, 2)).doc_id
+    assert len(early) == 24
+    assert early[:16] == f"{1735689600 * 10**6:016x}"
+    assert early < late
+
+
+def test_validate_write_reports_violations():
+    entry = _memory_entry(type=MemoryType.CONSENSUS, agent_id="crawler_01")
+    assert MemoryContract.validate_write("crawler_01", entry) == [
+        "Agent crawler_01 not authorized to write consensus"
+    ]
+    assert len(MemoryContract.validate_write("ceo_01", entry)) == 1
+
+
+def test_schema_dataclasses_are_slotted():
+    pred = Prediction(statement="s", horizon_days=7, confidence=0.5, tag="EMERGING")
+    assert not hasattr(pred, "__dict__")
+    assert pred.as_dict() == {
+        "statement": "s",
+        "horizon_days": 7,
+        "confidence": 0.5,
+        "tag": "EMERGING",
+        "signals": [],
+    }
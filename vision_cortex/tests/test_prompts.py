@@ -58,3 +58,75 @@ def test_executor_defers_low_confidence_auto():
     result = executor.execute("auto", confidence=0.5)
     assert result["status"] == "deferred"
     assert "below threshold" in result["reason"]
+
+
+def test_domain_prompts_resolve_from_table():
+    from vision_cortex.prompts import domain_registry
+
+    prompt = resolve_alias("heal")
+    assert prompt is domain_registry.AUTO_HEAL
+    assert prompt is domain_registry.DOMAIN_PROMPT_REGISTRY["AUTO_HEAL"]
+    assert len(domain_registry.DOMAIN_PROMPT_REGISTRY) == len(domain_registry._RAW)
+
+
+def test_prompt_definitions_are_frozen_and_hashable():
+    prompt = resolve_alias("scan")
+    assert isinstance(prompt.agents, tuple) and isinstance(prompt.tags, tuple)
+    assert {prompt: True}[prompt]
+    assert not hasattr(prompt, "__dict__")
+
+
+def test_executor_fuses_prompts_sharing_agents():
+    bus = MessageBus()
+    memory = MemoryRegistry(
+        firestore=InMemoryFirestore(), vector_store=InMemoryVectorStore()
+    )
+    executor = PromptExecutor(bus=bus, memory=memory)
+    builds = []
+    bus.subscribe("build_completed", builds.append)
+
+    # L3_SCENARIO_ANALYSIS and L9_PAPER_TRADING invoke the same agents.
+    results = executor.run_fused(["scenario", "paper", "nope"], confidence=0.9)
+
+    assert "error" in results["nope"]
+    assert results["scenario"]["status"] == "completed"
+    assert results["scenario"]["session_id"] == results["paper"]["session_id"]
+    assert len(builds) == 1
+
+
+def test_executor_fuses_prompts_with_covered_agent_sets():
+    bus = MessageBus()
+    memory = MemoryRegistry(
+        firestore=InMemoryFirestore(), vector_store=InMemoryVectorStore()
+    )
+    executor = PromptExecutor(bus=bus, memory=memory)
+    builds = []
+    bus.subscribe("build_completed", builds.append)
+
+    # AUTO_HEAL's agents cover AUTO_MAINTAIN's and AUTO_VALIDATE's, in any
+    # order; L1_SYSTEM_SCAN needs the crawler, which AUTO_HEAL does not run.
+    results = executor.run_fused(
+        ["validate", "maintain", "heal", "scan"], confidence=0.9
+    )
+
+    heal = results["heal"]
+    assert heal["status"] == "completed"
+    assert heal["governance_level"] == "HIGH"
+    assert heal["fused_with"] == ["AUTO_VALIDATE", "AUTO_MAINTAIN", "AUTO_HEAL"]
+    assert results["validate"]["session_id"] == heal["session_id"]
+    assert results["maintain"]["session_id"] == heal["session_id"]
+    assert results["scan"]["session_id"] != heal["session_id"]
+    assert len(builds) == 2
+
+
+def test_executor_accepts_prompt_definition():
+    bus = MessageBus()
+    memory = MemoryRegistry(
+        firestore=InMemoryFirestore(), vector_store=InMemoryVectorStore()
+    )
+    executor = PromptExecutor(bus=bus, memory=memory)
+
+    prompt = PROMPT_REGISTRY["L1_SYSTEM_SCAN"]
+    assert executor.execute(prompt, confidence=0.9)["prompt_id"] == prompt.id
+    fused = executor.run_fused([prompt], confidence=0.9)
+    assert fused[prompt.id]["status"] == "completed"
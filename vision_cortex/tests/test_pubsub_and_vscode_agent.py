@@ -1,3 +1,5 @@
+import asyncio
+
 from vision_cortex.comms.message_bus import MessageBus
 from vision_cortex.comms.pubsub_bridge import PubSubBridge
 from vision_cortex.memory.memory_registry import (
@@ -38,3 +40,30 @@ def test_vscode_agent_background_build():
     assert "summary" not in result  # orchestrator returns summary without nesting
     assert "observations" in result
     assert agent.pending_jobs() == 0
+
+
+def test_vscode_agent_async_build():
+    bus = MessageBus()
+    memory = MemoryRegistry(
+        firestore=InMemoryFirestore(), vector_store=InMemoryVectorStore()
+    )
+    agent = VSCodeAgent(bus=bus, memory=memory, max_workers=2)
+
+    result = asyncio.run(agent.run_build_async({"session_id": "sess-async"}))
+    agent.shutdown()
+
+    assert "observations" in result
+    assert agent.pending_jobs() == 0
+
+
+def test_system_build_finalizes_before_returning():
+    from vision_cortex.pipelines.system_build import SystemBuildOrchestrator
+
+    bus = MessageBus()
+    completed = []
+    bus.subscribe("build_completed", completed.append)
+    orchestrator = SystemBuildOrchestrator(bus=bus)
+
+    summary = orchestrator.run_build({"session_id": "sess-final"})
+
+    assert completed and completed[0]["summary"] is summary
@@ -1,5 +1,7 @@
 """Vision Cortex core behavior tests."""
 
+import pytest
+
 from vision_cortex.agents import (
     CrawlerAgent,
     DocumentorAgent,
@@ -10,8 +12,10 @@ from vision_cortex.agents import (
     ValidatorAgent,
     VisionaryAgent,
 )
-from vision_cortex.agents.base_agent import AgentContext
+from vision_cortex.agents.base_agent import AgentChain, AgentContext
+from vision_cortex.agents.run_cache import ToolRunCache, cached_run
 from vision_cortex.comms.message_bus import MessageBus
+from vision_cortex.instrumentation import observability
 from vision_cortex.memory.memory_registry import (
     InMemoryFirestore,
     InMemoryVectorStore,
@@ -111,3 +115,208 @@ def test_evolver_generates_improvements() -> None:
         ctx, {"validations": {"risks": [{"type": "test"}], "contradictions": []}}
     )
     assert result["improvements"]
+
+
+def test_vector_store_ranks_by_overlap_then_recency() -> None:
+    store = InMemoryVectorStore()
+    store.add("ai chips demand", {})
+    store.add("energy prices", {})
+    store.add("ai models ai chips", {})
+    store.add("shipping delays", {})
+
+    hits = store.search("ai chips", k=3)
+    assert [h["record"]["id"] for h in hits] == ["vec-3", "vec-1", "vec-4"]
+    assert [h["score"] for h in hits] == [2, 2, 0]
+
+
+def test_vector_store_lsh_finds_near_duplicates() -> None:
+    store = InMemoryVectorStore(lsh=True)
+    store.add("semiconductor supply chain disruption in asia", {})
+    store.add("quarterly earnings beat expectations", {})
+
+    hits = store.search("semiconductor supply chain disruptions in asia", k=1)
+    assert hits[0]["record"]["id"] == "vec-1"
+    assert hits[0]["score"] > 0.5
+
+
+def test_memory_registry_coalesces_persist_events() -> None:
+    registry = MemoryRegistry(
+        firestore=InMemoryFirestore(),
+        vector_store=InMemoryVectorStore(),
+        flush_interval=60,
+    )
+    registry.persist_event({"type": "a"})
+    registry.persist_event({"type": "b"})
+    assert registry.firestore.query("mcp_memory") == []
+
+    registry.flush()
+    assert [d["type"] for d in registry.firestore.query("mcp_memory")] == ["a", "b"]
+
+
+def test_memory_registry_requeues_failed_flush() -> None:
+    class FlakyFirestore(InMemoryFirestore):
+        down = True
+
+        def write(self, collection, doc) -> None:
+            if self.down:
+                raise ConnectionError("firestore unavailable")
+            super().write(collection, doc)
+
+    registry = MemoryRegistry(
+        firestore=FlakyFirestore(),
+        vector_store=InMemoryVectorStore(),
+        flush_interval=60,
+    )
+    registry.persist_event({"type": "a"})
+    with pytest.raises(ConnectionError):
+        registry.flush()
+
+    registry.persist_event({"type": "b"})
+    registry.firestore.down = False
+    registry.flush()
+    assert [d["type"] for d in registry.firestore.query("mcp_memory")] == ["a", "b"]
+
+
+def test_agent_chain_coalesces_stage_logs() -> None:
+    bus = MessageBus()
+    logs = []
+    bus.subscribe("logs", logs.append)
+    organizer = OrganizerAgent(name="organizer_01", role="organizer", bus=bus)
+    strategist = StrategistAgent(name="strategist_01", role="strategist", bus=bus)
+    context = AgentContext(session_id="sess-chain", task_id="task-chain")
+
+    results = AgentChain(bus=bus).run(
+        context,
+        [
+            ("organized", organizer, lambda r: {"observations": [], "ingested": []}),
+            ("strategy", strategist, lambda r: {"organized": r["organized"]}),
+        ],
+    )
+
+    assert set(results) == {"organized", "strategy"}
+    assert len(logs) == 1
+    assert len(logs[0]["extra"]["events"]) >= 2
+
+
+def test_cached_run_reuses_identical_payloads() -> None:
+    calls = []
+    organizer = OrganizerAgent(name="organizer_01", role="organizer", bus=MessageBus())
+    organizer.run_task = lambda ctx, payload: calls.append(payload) or {"n": 1}
+    cache = ToolRunCache(maxsize=2)
+    payload = {"observations": [{"title": "a"}], "ingested": []}
+
+    ctx = AgentContext(session_id="s", task_id="t")
+    first = cached_run(organizer, ctx, payload, cache=cache)
+    second = cached_run(organizer, ctx, dict(reversed(payload.items())), cache=cache)
+    assert first == second and len(calls) == 1 and cache.hits == 1
+    assert first is not second
+
+    critical = AgentContext(session_id="s", task_id="t", governance_level="CRITICAL")
+    cached_run(organizer, critical, payload, cache=cache)
+    assert len(calls) == 2
+
+
+def test_cached_run_replays_side_effects_per_session() -> None:
+    bus = MessageBus()
+    memory = _registry()
+    organizer = OrganizerAgent(
+        name="organizer_01", role="organizer", bus=bus, memory=memory
+    )
+    events = []
+    bus.subscribe("organized", events.append)
+    cache = ToolRunCache()
+
+    def payload(stamp: float) -> dict:
+        doc = {"title": "a", "text": "ai model"}
+        return {"cleaned": {"cleaned": [doc]}, "session_id": f"seed-{stamp}"}
+
+    first = cached_run(
+        organizer, AgentContext(session_id="s1", task_id="t1"), payload(1.0), cache
+    )
+    # Only per-run stamps differ, so the second session reuses the first run.
+    second = cached_run(
+        organizer, AgentContext(session_id="s2", task_id="t2"), payload(2.0), cache
+    )
+    assert cache.hits == 1 and second == first
+
+    records = [
+        doc
+        for doc in memory.firestore.query("mcp_memory")
+        if doc["type"] == "organized_batch"
+    ]
+    assert [r["session_hash"] for r in records] == ["s1", "s2"]
+    assert [r["task_id"] for r in records] == ["t1", "t2"]
+    assert [e["context"]["session_id"] for e in events] == ["s1", "s2"]
+
+    # Results that echo per-run stamps are never served to another run.
+    for stamp in (1.0, 2.0):
+        doc = {"title": "b", "text": "ai model", "timestamp": stamp}
+        result = cached_run(
+            organizer,
+            AgentContext(session_id=f"s{stamp}", task_id="t"),
+            {"cleaned": {"cleaned": [doc]}},
+            cache,
+        )
+        assert result["clusters"]["ai"][0]["timestamp"] == stamp
+    assert cache.hits == 1 and len(cache) == 1
+
+
+def test_run_cache_keys_reuse_shared_encodings() -> None:
+    from vision_cortex.agents.run_cache import shared_encoding
+
+    organizer = OrganizerAgent(name="organizer_01", role="organizer", bus=MessageBus())
+    shared = {"clusters": {"ai": [{"title": "a"}]}}
+    plain = ToolRunCache.key(organizer, {"organized": shared, "n": 1})
+    with shared_encoding():
+        first = ToolRunCache.key(organizer, {"organized": shared, "n": 1})
+        second = ToolRunCache.key(organizer, {"n": 1, "organized": shared})
+    assert plain == first == second
+
+
+def test_debate_cycle_skips_agents_without_predictions() -> None:
+    bus = MessageBus()
+    agents = [
+        cls(name=f"{role}_empty", role=role, bus=bus)
+        for cls, role in (
+            (PredictorAgent, "predictor"),
+            (VisionaryAgent, "visionary"),
+            (StrategistAgent, "strategist"),
+            (ValidatorAgent, "validator"),
+            (DocumentorAgent, "documentor"),
+        )
+    ]
+    topics = []
+    for topic in ("scenarios", "strategy", "validation", "reports"):
+        bus.subscribe(topic, lambda msg, topic=topic: topics.append(topic))
+
+    output = DebateCycle(*agents).run("sess-empty", "task-empty", {"clusters": {}})
+
+    assert output["debate"].turns == [] and output["debate"].consensus is None
+    assert output["document"] == {} and topics == []
+
+
+def test_task_flush_keeps_payloads_until_redis_write_succeeds(monkeypatch) -> None:
+    class FlakyRedis:
+        def __init__(self) -> None:
+            self.down = True
+            self.data = {}
+
+        def mset(self, mapping) -> None:
+            if self.down:
+                raise ConnectionError("redis unavailable")
+            self.data.update(mapping)
+
+        def get(self, key):
+            return self.data.get(key)
+
+    redis = FlakyRedis()
+    monkeypatch.setattr(observability, "_redis", redis)
+    monkeypatch.setattr(observability, "_PENDING_TASKS", {"t1": {"status": "done"}})
+
+    assert not observability.flush_tasks()
+    assert observability.get_task("t1") == {"status": "done"}
+
+    redis.down = False
+    assert observability.flush_tasks()
+    assert observability._PENDING_TASKS == {}
+    assert observability.get_task("t1") == {"status": "done"}
@@ -0,0 +1,168 @@
+"""Tests for the operational schedule manager."""
+
+import json
+import os
+from datetime import datetime
+
+from vision_cortex.scheduler import Scheduler, Task, TaskStatus
+
+
+def _scheduler(tmp_path) -> Scheduler:
+    config = {
+        "scheduling": {
+            "calendar_events": [
+                {
+                    "event_id": "daily",
+                    "name": "Daily",
+                    "description": "",
+                    "frequency": "daily",
+                    "time": "03:00 UTC",
+                    "duration_minutes": 5,
+                    "responsible_agent": "crawler",
+                },
+                {
+                    "event_id": "weekly",
+                    "name": "Weekly",
+                    "description": "",
+                    "frequency": "weekly",
+                    "time": "03:00 UTC",
+                    "duration_minutes": 5,
+                    "responsible_agent": "evolver",
+                    "day": "Friday",
+                },
+                {
+                    "event_id": "monthly",
+                    "name": "Monthly",
+                    "description": "",
+                    "frequency": "monthly",
+                    "time": "12:00 UTC",
+                    "duration_minutes": 5,
+                    "responsible_agent": "evolver",
+                    "day": "31",
+                },
+            ]
+        },
+        "tasks": {
+            "google_task_lists": [
+                {
+                    "list_id": "build",
+                    "name": "Build",
+                    "owner": "ops",
+                    "tasks": [
+                        {"task_id": "t1", "title": "One", "status": "completed"},
+                        {"task_id": "t2", "title": "Two", "priority": "high"},
+                    ],
+                }
+            ]
+        },
+    }
+    path = tmp_path / "schedule.json"
+    path.write_text(json.dumps(config))
+    scheduler = Scheduler(str(path))
+    assert scheduler.load_config()
+    return scheduler
+
+
+def test_due_events_fire_once_per_slot(tmp_path):
+    scheduler = _scheduler(tmp_path)
+    friday = datetime(2027, 1, 1, 3, 0, 10)  # a Friday
+
+    due = [e.event_id for e in scheduler.get_due_events(friday)]
+    assert due == ["daily", "weekly"]
+    assert scheduler.get_due_events(friday.replace(second=40)) == []
+    assert scheduler.get_due_events(datetime(2027, 1, 1, 3, 1)) == []
+
+    daily = scheduler._events["daily"]
+    assert daily.next_run == datetime(2027, 1, 2, 3, 0)
+
+
+def test_due_events_skip_missed_slots_and_short_months(tmp_path):
+    scheduler = _scheduler(tmp_path)
+
+    assert scheduler.get_due_events(datetime(2027, 1, 1, 3, 5)) == []
+    assert scheduler._events["monthly"].next_run == datetime(2027, 1, 31, 12, 0)
+    assert scheduler.get_due_events(datetime(2027, 2, 2, 12, 0)) == []
+    assert scheduler._events["monthly"].next_run == datetime(2027, 3, 31, 12, 0)
+
+    # Polling an earlier time reschedules from that point.
+    due = scheduler.get_due_events(datetime(2027, 1, 31, 12, 0))
+    assert [e.event_id for e in due] == ["monthly"]
+
+
+def test_config_parse_is_reused_until_file_changes(tmp_path):
+    first = _scheduler(tmp_path)
+    path = first.config_path
+    again = Scheduler(str(path))
+    assert again.load_config()
+    assert again.get_task_list("build").tasks[1].title == "Two"
+
+    config = json.loads(path.read_text())
+    config["tasks"]["google_task_lists"][0]["tasks"][1]["title"] = "Changed"
+    path.write_text(json.dumps(config))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    changed = Scheduler(str(path))
+    assert changed.load_config()
+    assert changed.get_task_list("build").tasks[1].title == "Changed"
+
+
+def test_update_task_status_by_index(tmp_path):
+    scheduler = _scheduler(tmp_path)
+
+    assert scheduler.update_task_status("build", "t2", TaskStatus.COMPLETED)
+    assert scheduler.get_task_list("build").tasks[1].completed_at is not None
+    assert not scheduler.update_task_status("build", "missing", TaskStatus.BLOCKED)
+    assert not scheduler.update_task_status("nope", "t1", TaskStatus.BLOCKED)
+
+    scheduler.get_task_list("build").tasks.append(Task(task_id="t3", title="Three"))
+    assert scheduler.update_task_status("build", "t3", TaskStatus.BLOCKED)
+
+
+def test_status_counters_follow_updates(tmp_path):
+    scheduler = _scheduler(tmp_path)
+    assert scheduler.get_status()["completed_tasks"] == 1
+
+    scheduler.update_task_status("build", "t2", TaskStatus.COMPLETED)
+    scheduler.update_task_status("build", "t2", TaskStatus.COMPLETED)
+    scheduler.update_task_status("build", "t1", TaskStatus.IN_PROGRESS)
+    status = scheduler.get_status()
+    assert (status["total_tasks"], status["completed_tasks"]) == (2, 1)
+    assert status["pending_tasks"] == 1
+
+
+def test_pending_accessors(tmp_path):
+    scheduler = _scheduler(tmp_path)
+    task_list = scheduler.get_task_list("build")
+
+    assert [t.task_id for t in task_list.get_pending()] == ["t2"]
+    assert [t.task_id for t in task_list.get_completed()] == ["t1"]
+    assert [t.task_id for t in scheduler.get_all_pending_tasks()] == ["t2"]
+
+
+def test_export_schedule_bytes_round_trips(tmp_path):
+    scheduler = _scheduler(tmp_path)
+    scheduler.get_due_events(datetime(2027, 1, 1, 3, 0))
+
+    assert json.loads(scheduler.export_schedule_bytes()) == scheduler.export_schedule()
+
+
+def test_task_list_dict_is_reused_until_updated(tmp_path):
+    scheduler = _scheduler(tmp_path)
+    task_list = scheduler.get_task_list("build")
+
+    first = task_list.to_dict()
+    assert task_list.to_dict() is first
+
+    scheduler.update_task_status("build", "t2", TaskStatus.BLOCKED)
+    refreshed = task_list.to_dict()
+    assert refreshed is not first
+    assert refreshed["tasks"][1]["status"] == "blocked"
+
+
+def test_same_minute_events_keep_load_order(tmp_path):
+    scheduler = _scheduler(tmp_path)
+
+    for day in range(1, 16):
+        due = [e.event_id for e in scheduler.get_due_events(datetime(2027, 1, day, 3))]
+        assert due == (["daily", "weekly"] if day in (1, 8, 15) else ["daily"])
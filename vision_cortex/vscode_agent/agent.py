@@ -8,10 +8,11 @@ Capabilities:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import threading
 from concurrent.futures import Future, ThreadPoolExecutor
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Set
 
 from vision_cortex.comms.message_bus import MessageBus
 from vision_cortex.comms.pubsub_bridge import PubSubBridge
@@ -37,7 +38,8 @@ class VSCodeAgent:
         )
         self.pool = ThreadPoolExecutor(max_workers=max_workers)
         self.logger = logging.getLogger("vision_cortex.vscode_agent")
-        self._futures: List[Future] = []
+        # In-flight builds only; each future drops itself when it finishes.
+        self._futures: Set[Future] = set()
         self._lock = threading.Lock()
         self.bus.subscribe("build_completed", self._handle_build_completed)
 
@@ -51,10 +53,19 @@ class VSCodeAgent:
         )
         future = self.pool.submit(self.orchestrator.run_build, seed)
         with self._lock:
-            self._futures.append(future)
+            self._futures.add(future)
+        future.add_done_callback(self._forget)
         self.logger.info("Queued background build session=%s", seed.get("session_id"))
         return future
 
+    async def run_build_async(self, seed: Dict[str, Any]) -> Dict[str, Any]:
+        """Await a background build from async handlers (e.g. scheduler events).
+
+        Runs on the same bounded pool as run_background_build, so the event
+        loop is never blocked and no extra threads are started.
+        """
+        return await asyncio.wrap_future(self.run_background_build(seed))
+
     def run_parallel_builds(self, seeds: List[Dict[str, Any]]) -> List[Future]:
         futures: List[Future] = []
         for seed in seeds:
@@ -86,6 +97,10 @@ class VSCodeAgent:
             governance_level=self.governance_level,
         )
 
+    def _forget(self, future: Future) -> None:
+        with self._lock:
+            self._futures.discard(future)
+
     def pending_jobs(self) -> int:
         with self._lock:
             return sum(1 for f in self._futures if not f.done())
@@ -0,0 +1,48 @@
+"""Pooled HTTP session shared by the job workers."""
+
+import os
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+# Longest response body kept in a job result; error pages can be large.
+TEXT_LIMIT = int(os.environ.get("WORKER_RESULT_TEXT_LIMIT", "4096"))
+# (connect, read) seconds for every job request, so a hung API call fails
+# the job instead of holding it running until its lease runs out.
+TIMEOUT = (
+    float(os.environ.get("WORKER_CONNECT_TIMEOUT", "5")),
+    float(os.environ.get("WORKER_READ_TIMEOUT", "60")),
+)
+
+# One keep-alive pool per host, so consecutive jobs against the same API
+# skip DNS, TCP and TLS setup. Transient failures are retried here, over the
+# same pool, instead of failing the job. Every job is a POST and sending a
+# mail or creating a repo is not idempotent, so only failures where the
+# server did no work are retried: connection errors, 429 and 503 (honouring
+# Retry-After). Read errors and other 5xx are not, as the request may have
+# been applied. The last response is returned rather than raised.
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3,
+            read=0,
+            backoff_factor=0.3,
+            status_forcelist=(429, 503),
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+            raise_on_status=False,
+        ),
+    ),
+)
+
+
+def response_text(response, limit=TEXT_LIMIT):
+    """Return the response body, cut to ``limit`` characters for storage."""
+    text = response.text
+    if len(text) <= limit:
+        return text
+    return text[:limit] + "...[truncated]"
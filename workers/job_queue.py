@@ -0,0 +1,267 @@
+"""Shared helpers for the workers that poll the ``jobs`` table."""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+try:
+    import orjson
+
+    loads = orjson.loads
+
+    def dumps(obj):
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    loads = json.loads
+    dumps = json.dumps
+
+logger = logging.getLogger(__name__)
+
+WAKE_TICK = float(os.environ.get("WORKER_WAKE_TICK", "0.25"))
+# First idle wait after a busy poll; doubles up to the worker's POLL.
+MIN_POLL = float(os.environ.get("WORKER_MIN_POLL", "0.05"))
+# Seconds a claimed job may go without its lease being renewed before it is
+# treated as abandoned (its worker crashed or failed mid-batch). Running jobs
+# renew every RENEW_INTERVAL, so only dead workers' jobs ever expire.
+LEASE = float(os.environ.get("WORKER_LEASE", "900"))
+RENEW_INTERVAL = LEASE / 3
+SWEEP_INTERVAL = 60.0
+
+# Shared statement text: sqlite3 caches compiled statements per connection,
+# keyed on the SQL string, so long-lived worker connections reuse them.
+# Claiming marks the rows running in the same statement that returns them,
+# so two workers can never pick up the same job (RETURNING: SQLite 3.35+).
+# updated_at records when the lease started.
+CLAIM_SQL = (
+    "UPDATE jobs SET status='running', updated_at=CURRENT_TIMESTAMP WHERE id IN ("
+    "SELECT id FROM jobs WHERE status='pending' AND action=? "
+    "ORDER BY created_at ASC LIMIT ?"
+    ") RETURNING id,type,action,payload"
+)
+UPDATE_RESULT_SQL = (
+    "UPDATE jobs SET status=?, result=?, updated_at=CURRENT_TIMESTAMP WHERE id=?"
+)
+RENEW_SQL = (
+    "UPDATE jobs SET updated_at=CURRENT_TIMESTAMP WHERE id=? AND status='running'"
+)
+REQUEUE_SQL = (
+    "UPDATE jobs SET status='pending', updated_at=CURRENT_TIMESTAMP "
+    "WHERE status='running' AND action=? "
+    "AND COALESCE(updated_at, created_at) < datetime('now', ?)"
+)
+EXPIRE_SQL = (
+    "UPDATE jobs SET status='error', result=?, updated_at=CURRENT_TIMESTAMP "
+    "WHERE status='running' AND action=? "
+    "AND COALESCE(updated_at, created_at) < datetime('now', ?)"
+)
+EXPIRED_RESULT = dumps(
+    {"status": "error", "error": "lease expired; the job may already have run"}
+)
+
+
+def connect(db):
+    """Open a worker connection in WAL mode.
+
+    WAL lets the API and the other workers keep reading while a worker
+    commits; synchronous=NORMAL is durable under WAL and skips the fsync
+    on every commit. sqlite3's default 5s timeout already acts as the
+    busy timeout.
+    """
+    conn = sqlite3.connect(db, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def ensure_pending_index(conn):
+    """Index pending jobs so the poll seeks instead of scanning job history.
+
+    The partial index only holds pending rows and already orders them by
+    created_at, so CLAIM_SQL needs neither a scan nor a sort.
+    Skipped if the jobs table has not been created yet.
+    """
+    try:
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_jobs_pending "
+            "ON jobs(created_at) WHERE status='pending'"
+        )
+        conn.execute("PRAGMA optimize")
+        conn.commit()
+    except sqlite3.OperationalError:
+        conn.rollback()
+
+
+def claim_jobs(conn, action, limit=5):
+    """Mark up to ``limit`` pending ``action`` jobs running and return them."""
+    with conn:
+        rows = conn.execute(CLAIM_SQL, (action, limit)).fetchall()
+    rows.sort()  # RETURNING order is unspecified; ids follow creation order
+    return rows
+
+
+def requeue_stale(conn, action, lease=LEASE, retry=False):
+    """Release ``action`` jobs whose lease has expired.
+
+    With ``retry`` they go back to pending and run again, which is only safe
+    for idempotent actions. Otherwise (sending a mail, creating a repo) the
+    job may already have been applied, so it is marked error instead.
+    """
+    age = f"-{lease} seconds"
+    with conn:
+        if retry:
+            count = conn.execute(REQUEUE_SQL, (action, age)).rowcount
+        else:
+            count = conn.execute(EXPIRE_SQL, (EXPIRED_RESULT, action, age)).rowcount
+    if count:
+        logger.warning(
+            "%s %d stale %s job(s)", "Requeued" if retry else "Expired", count, action
+        )
+    return count
+
+
+@contextmanager
+def keep_leased(db, job_ids, interval=None):
+    """Renew the lease on ``job_ids`` every ``interval`` seconds while inside.
+
+    A background thread stamps updated_at on its own connection, so jobs
+    that legitimately run longer than LEASE are not expired under a worker
+    that is still working on them.
+    """
+    if not job_ids:
+        yield
+        return
+    interval = RENEW_INTERVAL if interval is None else interval
+    stop = threading.Event()
+
+    def renew():
+        while not stop.wait(interval):
+            try:
+                conn = sqlite3.connect(db)
+                try:
+                    with conn:
+                        conn.executemany(RENEW_SQL, [(i,) for i in job_ids])
+                finally:
+                    conn.close()
+            except sqlite3.Error:
+                logger.exception("Could not renew job leases")
+
+    thread = threading.Thread(target=renew, name="lease-renewal", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+def run_batch(conn, rows, run_job, executor):
+    """Run claimed jobs concurrently and record all results in one commit.
+
+    Jobs are HTTPS round trips, so a batch takes about as long as its
+    slowest job rather than the sum of them.
+    """
+    for r in rows:
+        logger.debug("Processing job %s %s", r[0], r[2])
+    updates = [
+        (res.get("status", "done"), dumps(res), r[0])
+        for r, res in zip(rows, executor.map(run_job, rows))
+    ]
+    if updates:
+        with conn:  # one transaction (and fsync) for the whole batch
+            conn.executemany(UPDATE_RESULT_SQL, updates)
+
+
+class JobSignal:
+    """Wakes a worker when the jobs database changes instead of sleeping blind.
+
+    SQLite has no cross-process notifications, but ``PRAGMA data_version``
+    changes whenever another connection commits and reading it touches no
+    table. ``wait`` checks it every ``tick`` seconds and returns early on a
+    change, or immediately on ``notify()`` from a producer in this process.
+    """
+
+    def __init__(self, db, tick=WAKE_TICK):
+        self._conn = sqlite3.connect(db, check_same_thread=False)
+        self._event = threading.Event()
+        self._version = self._data_version()
+        self.tick = tick
+
+    def _data_version(self):
+        try:
+            return self._conn.execute("PRAGMA data_version").fetchone()[0]
+        except sqlite3.Error:
+            return None
+
+    def notify(self):
+        self._event.set()
+
+    def wait(self, timeout):
+        """Block for up to ``timeout`` seconds; True if new jobs may exist."""
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if self._event.wait(min(self.tick, remaining)):
+                self._event.clear()
+                return True
+            version = self._data_version()
+            if version is None or version != self._version:
+                self._version = version
+                return True
+
+
+def poll_forever(db, actions, run_job, batch, poll):
+    """Claim and run ``actions`` jobs from ``db`` until the process exits.
+
+    Each pass claims up to ``batch`` jobs per action and runs them on a pool
+    of ``batch`` threads. After a pass that found work the next one follows
+    within MIN_POLL; idle waits double up to ``poll``. The claim is skipped
+    until another connection commits, since no new job can appear without a
+    commit to the database. Every SWEEP_INTERVAL seconds jobs whose lease
+    expired are marked error, since these actions are not safe to retry;
+    leases of the running batch are renewed until its results are stored.
+    """
+    wakeup = JobSignal(db)
+    executor = ThreadPoolExecutor(max_workers=batch)
+    conn = None
+    delay = MIN_POLL
+    dirty = True  # claim once at startup
+    next_sweep = 0.0
+    while True:
+        rows = []
+        sweep = time.monotonic() >= next_sweep
+        if dirty or sweep:
+            try:
+                if conn is None:
+                    conn = connect(db)
+                    ensure_pending_index(conn)
+                if sweep:
+                    for action in actions:
+                        requeue_stale(conn, action)
+                    next_sweep = time.monotonic() + SWEEP_INTERVAL
+                for action in actions:
+                    rows.extend(claim_jobs(conn, action, batch))
+                with keep_leased(db, [r[0] for r in rows]):
+                    run_batch(conn, rows, run_job, executor)
+                # Jobs were found, so more may be waiting behind them.
+                dirty = bool(rows)
+            except sqlite3.Error:
+                # Reconnect on the next pass; the connection may be unusable.
+                logger.exception("Worker database error")
+                if conn is not None:
+                    conn.close()
+                conn = None
+            except Exception:
+                logger.exception("Worker error")
+                if conn is not None:
+                    conn.rollback()
+        delay = MIN_POLL if rows else min(delay * 2, poll)
+        if wakeup.wait(delay):
+            dirty = True
@@ -13,7 +13,8 @@ def run_once():
     conn = get_conn()
     cur = conn.cursor()
     cur.execute(
-        "SELECT id,type,action,payload,status,result FROM jobs WHERE status='pending' AND action='crawl/start' ORDER BY created_at ASC LIMIT 1"
+        "SELECT id,type,action,payload FROM jobs WHERE status='pending' "
+        "AND action='crawl/start' ORDER BY created_at ASC LIMIT 1"
     )
     row = cur.fetchone()
     if not row:
@@ -0,0 +1,38 @@
+"""Run the gcloud, GitHub and Gmail job workers in one process.
+
+Jobs are almost entirely HTTPS round trips, so one process with a thread
+pool replaces the three single-purpose workers: one interpreter, one
+database connection and poll, and one pooled session and credential cache
+per API instead of one per process. The per-action workers still work on
+their own.
+"""
+
+import logging
+import os
+
+import worker_gcloud
+import worker_github
+import worker_gworkspace
+from job_queue import poll_forever
+
+logger = logging.getLogger(__name__)
+
+DB = os.environ.get("MCP_MEMORY_DB", "./mcp_memory.db").replace("sqlite:///", "")
+POLL = float(os.environ.get("WORKER_POLL", "5"))
+MAX_WORKERS = int(os.environ.get("WORKER_THREADS", "16"))
+HANDLERS = {
+    module.ACTION: module.run_job
+    for module in (worker_gcloud, worker_github, worker_gworkspace)
+}
+
+
+def run_job(row):
+    return HANDLERS[row[2]](row)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(format="%(asctime)s %(name)s %(message)s", level=logging.INFO)
+    logger.info("Combined worker starting, DB=%s actions=%s", DB, sorted(HANDLERS))
+    worker_gcloud.prewarm()
+    worker_gworkspace.prewarm()
+    poll_forever(DB, tuple(HANDLERS), run_job, MAX_WORKERS, POLL)
@@ -1,22 +1,43 @@
 import asyncio
-import json
+import logging
 import os
+import random
 import sqlite3
+import time
+
+from job_queue import UPDATE_RESULT_SQL, dumps, keep_leased, loads, requeue_stale
 
 from async_crawler import crawl_url
 from safety import filter_allowed_domains, validate_url
 
+logger = logging.getLogger(__name__)
+
 DB = os.environ.get("MCP_MEMORY_DB", "./mcp_memory.db").replace("sqlite:///", "")
 POLL = float(os.environ.get("WORKER_POLL", "2"))
+MAX_POLL = float(os.environ.get("WORKER_MAX_POLL", "30"))
+
+# Claim and fetch in one statement so two workers never take the same job
+# (UPDATE ... RETURNING needs SQLite 3.35+).
+CLAIM_SQL = (
+    "UPDATE jobs SET status='running', updated_at=CURRENT_TIMESTAMP WHERE id = ("
+    "SELECT id FROM jobs WHERE status='pending' AND action='crawl/start' "
+    "ORDER BY created_at ASC LIMIT 1"
+    ") RETURNING id,type,action,payload"
+)
 
 
 def get_conn():
-    return sqlite3.connect(DB, check_same_thread=False)
+    conn = sqlite3.connect(DB, check_same_thread=False)
+    # WAL lets the API read while a crawl batch commits; NORMAL sync is safe
+    # under WAL and avoids an fsync per commit.
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
 
 
 async def process_job(row):
-    job_id, jtype, action, payload, status, result = row[:6]
-    payload = json.loads(payload or "{}")
+    job_id, jtype, action, payload = row
+    payload = loads(payload or "{}")
     start = payload.get("start_url")
     if not start:
         return {"status": "error", "error": "missing start_url"}
@@ -44,46 +65,68 @@ async def process_job(row):
     except Exception as e:
         return {"status": "error", "error": str(e)}
     # store pages into memory table
+    ns = payload.get("namespace", "crawls")
+    rows = [
+        (ns, r["url"], dumps({"url": r["url"], "html": r["html"]})) for r in results
+    ]
     conn = get_conn()
-    cur = conn.cursor()
-    for r in results:
-        ns = payload.get("namespace", "crawls")
-        key = r["url"]
-        cur.execute(
-            "INSERT INTO memory (namespace, key, value) VALUES (?,?,?)",
-            (ns, key, json.dumps({"url": r["url"], "html": r["html"]})),
-        )
-    conn.commit()
-    conn.close()
+    try:
+        with conn:  # one transaction for the whole batch
+            conn.executemany(
+                "INSERT INTO memory (namespace, key, value) VALUES (?,?,?)", rows
+            )
+    finally:
+        conn.close()
     return {"status": "done", "count": len(results)}
 
 
+def claim_job(conn):
+    """Atomically mark the oldest pending crawl job running and return it.
+
+    Crawl jobs whose lease expired (their worker died) are requeued first;
+    re-crawling only reads from the web, so retrying them is safe.
+    """
+    requeue_stale(conn, "crawl/start", retry=True)
+    with conn:
+        rows = conn.execute(CLAIM_SQL).fetchall()
+    return rows[0] if rows else None
+
+
 def run_loop():
-    print("Crawler worker starting")
+    logger.info("Crawler worker starting")
+    delay = POLL
     while True:
+        row = None
         try:
             conn = get_conn()
-            cur = conn.cursor()
-            cur.execute(
-                "SELECT id,type,action,payload,status,result FROM jobs WHERE status='pending' AND action='crawl/start' ORDER BY created_at ASC LIMIT 1"
-            )
-            row = cur.fetchone()
-            if row:
-                job_id = row[0]
-                print("Running crawl job", job_id)
-                res = asyncio.run(process_job(row))
-                cur.execute(
-                    "UPDATE jobs SET status=?, result=? WHERE id=?",
-                    (res.get("status", "done"), json.dumps(res), job_id),
-                )
-                conn.commit()
-            conn.close()
-        except Exception as e:
-            print("Crawler worker error", e)
-        import time
-
-        time.sleep(POLL)
+            try:
+                row = claim_job(conn)
+                if row:
+                    job_id = row[0]
+                    logger.debug("Running crawl job %s", job_id)
+                    try:
+                        with keep_leased(DB, [job_id]):
+                            res = asyncio.run(process_job(row))
+                    except Exception as e:
+                        res = {"status": "error", "error": str(e)}
+                    with conn:
+                        conn.execute(
+                            UPDATE_RESULT_SQL,
+                            (res.get("status", "done"), dumps(res), job_id),
+                        )
+            finally:
+                conn.close()
+        except Exception:
+            logger.exception("Crawler worker error")
+        if row:
+            # Work found: look for the next job straight away.
+            delay = POLL
+            continue
+        # Idle or failing: back off with jitter so workers don't poll in step.
+        time.sleep(delay + random.uniform(0, 0.25 * delay))
+        delay = min(delay * 1.5, MAX_POLL)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(format="%(asctime)s %(name)s %(message)s", level=logging.INFO)
     run_loop()
@@ -1,51 +1,83 @@
-import json
+import logging
 import os
-import sqlite3
-import time
+import threading
 
-import requests
+from google.auth.transport.requests import Request
 from google.oauth2 import service_account
+from http_client import SESSION, TIMEOUT, response_text
+from job_queue import connect, loads, poll_forever
+
+logger = logging.getLogger(__name__)
 
 DB = os.environ.get("MCP_MEMORY_DB", "./mcp_memory.db").replace("sqlite:///", "")
 POLL = float(os.environ.get("WORKER_POLL", "5"))
+BATCH = int(os.environ.get("WORKER_BATCH", "5"))
+# Only this worker's jobs are claimed; other actions are left for their workers.
+ACTION = "cloudrun/deploy"
+SCOPES = ["https://www.googleapis.com/auth/cloud-platform"]
+
+# Loaded once and reused across jobs; google-auth keeps the access token and
+# its expiry, so the token endpoint is only hit when the token runs out.
+_CREDS = None
+_CREDS_LOCK = threading.Lock()
+# Token refreshes go through the pooled session too.
+AUTH_REQ = Request(session=SESSION)
 
 
 def get_conn():
-    return sqlite3.connect(DB, check_same_thread=False)
+    return connect(DB)
 
 
-def run_job(row):
-    job_id, jtype, action, payload, status, result = row[:6]
-    payload = json.loads(payload or "{}")
-    try:
-        if action == "cloudrun/deploy":
+def get_token():
+    global _CREDS
+    with _CREDS_LOCK:
+        if _CREDS is None:
             creds_path = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS")
             if not creds_path:
                 raise RuntimeError("No GOOGLE_APPLICATION_CREDENTIALS")
-            # For simplicity, call Cloud Run REST API using oauth2 client access token
-            creds = service_account.Credentials.from_service_account_file(
-                creds_path, scopes=["https://www.googleapis.com/auth/cloud-platform"]
+            _CREDS = service_account.Credentials.from_service_account_file(
+                creds_path, scopes=SCOPES
             )
-            auth = creds.with_scopes(["https://www.googleapis.com/auth/cloud-platform"])
-            auth.refresh(requests.Request())
-            token = auth.token
+        if not _CREDS.valid:
+            _CREDS.refresh(AUTH_REQ)
+        return _CREDS.token
+
+
+def prewarm():
+    """Load the credentials and a token before the first job needs them."""
+    try:
+        get_token()
+    except Exception:
+        logger.warning(
+            "Credential prewarm failed; retrying on first job", exc_info=True
+        )
+
+
+def run_job(row):
+    job_id, jtype, action, payload = row
+    payload = loads(payload or "{}")
+    try:
+        if action == ACTION:
+            # For simplicity, call Cloud Run REST API using oauth2 client access token
+            token = get_token()
             project = payload.get("project")
             region = payload.get("region", "us-central1")
             service_id = payload.get("service_id")
             service_body = payload.get("service")
             url = f"https://run.googleapis.com/v1/projects/{project}/locations/{region}/services?serviceId={service_id}"
-            r = requests.post(
+            r = SESSION.post(
                 url,
                 json=service_body,
                 headers={
                     "Authorization": f"Bearer {token}",
                     "Content-Type": "application/json",
                 },
+                timeout=TIMEOUT,
             )
             return {
                 "status": "done" if r.status_code < 400 else "error",
                 "http_status": r.status_code,
-                "text": r.text,
+                "text": response_text(r),
             }
         else:
             return {"status": "unknown action"}
@@ -54,25 +86,7 @@ def run_job(row):
 
 
 if __name__ == "__main__":
-    print("GCloud worker starting, DB=", DB)
-    while True:
-        try:
-            conn = get_conn()
-            cur = conn.cursor()
-            cur.execute(
-                "SELECT id,type,action,payload,status,result FROM jobs WHERE status='pending' ORDER BY created_at ASC LIMIT 5"
-            )
-            rows = cur.fetchall()
-            for r in rows:
-                job_id = r[0]
-                print("Processing job", job_id, r[2])
-                res = run_job(r)
-                cur.execute(
-                    "UPDATE jobs SET status=?, result=? WHERE id=?",
-                    (res.get("status", "done"), json.dumps(res), job_id),
-                )
-                conn.commit()
-            conn.close()
-        except Exception as e:
-            print("Worker error", e)
-        time.sleep(POLL)
+    logging.basicConfig(format="%(asctime)s %(name)s %(message)s", level=logging.INFO)
+    logger.info("GCloud worker starting, DB=%s", DB)
+    prewarm()
+    poll_forever(DB, (ACTION,), run_job, BATCH, POLL)
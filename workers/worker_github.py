@@ -1,40 +1,45 @@
-import json
+import logging
 import os
-import sqlite3
-import time
 
-import requests
+from http_client import SESSION, TIMEOUT, response_text
+from job_queue import connect, loads, poll_forever
+
+logger = logging.getLogger(__name__)
 
 DB = os.environ.get("MCP_MEMORY_DB", "./mcp_memory.db").replace("sqlite:///", "")
 POLL = float(os.environ.get("WORKER_POLL", "5"))
+BATCH = int(os.environ.get("WORKER_BATCH", "5"))
+# Only this worker's jobs are claimed; other actions are left for their workers.
+ACTION = "repo/create"
 
 
 def get_conn():
-    return sqlite3.connect(DB, check_same_thread=False)
+    return connect(DB)
 
 
 def run_job(row):
-    job_id, jtype, action, payload, status, result = row[:6]
-    payload = json.loads(payload or "{}")
+    job_id, jtype, action, payload = row
+    payload = loads(payload or "{}")
     try:
-        if action == "repo/create":
+        if action == ACTION:
             token = payload.get("token")
             name = payload.get("name")
             private = payload.get("private", True)
             if not token or not name:
                 raise RuntimeError("Missing token or name")
-            r = requests.post(
+            r = SESSION.post(
                 "https://api.github.com/user/repos",
                 json={"name": name, "private": private},
                 headers={
                     "Authorization": f"token {token}",
                     "Accept": "application/vnd.github+json",
                 },
+                timeout=TIMEOUT,
             )
             return {
                 "status": "done" if r.status_code < 400 else "error",
                 "http_status": r.status_code,
-                "text": r.text,
+                "text": response_text(r),
             }
         else:
             return {"status": "unknown action"}
@@ -43,25 +48,6 @@ def run_job(row):
 
 
 if __name__ == "__main__":
-    print("GitHub worker starting, DB=", DB)
-    while True:
-        try:
-            conn = get_conn()
-            cur = conn.cursor()
-            cur.execute(
-                "SELECT id,type,action,payload,status,result FROM jobs WHERE status='pending' ORDER BY created_at ASC LIMIT 5"
-            )
-            rows = cur.fetchall()
-            for r in rows:
-                job_id = r[0]
-                print("Processing job", job_id, r[2])
-                res = run_job(r)
-                cur.execute(
-                    "UPDATE jobs SET status=?, result=? WHERE id=?",
-                    (res.get("status", "done"), json.dumps(res), job_id),
-                )
-                conn.commit()
-            conn.close()
-        except Exception as e:
-            print("Worker error", e)
-        time.sleep(POLL)
+    logging.basicConfig(format="%(asctime)s %(name)s %(message)s", level=logging.INFO)
+    logger.info("GitHub worker starting, DB=%s", DB)
+    poll_forever(DB, (ACTION,), run_job, BATCH, POLL)
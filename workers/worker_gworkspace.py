@@ -1,36 +1,79 @@
-import json
+import logging
 import os
-import sqlite3
-import time
+import threading
 
+from google.auth.transport.requests import Request
 from google.oauth2 import service_account
-from googleapiclient.discovery import build
+from http_client import SESSION, TIMEOUT, response_text
+from job_queue import connect, loads, poll_forever
+
+logger = logging.getLogger(__name__)
 
 DB = os.environ.get("MCP_MEMORY_DB", "./mcp_memory.db").replace("sqlite:///", "")
 POLL = float(os.environ.get("WORKER_POLL", "5"))
+BATCH = int(os.environ.get("WORKER_BATCH", "5"))
+# Only this worker's jobs are claimed; other actions are left for their workers.
+ACTION = "gmail/send"
+SCOPES = ["https://www.googleapis.com/auth/gmail.send"]
+SEND_URL = "https://gmail.googleapis.com/gmail/v1/users/me/messages/send"
+
+# Loaded once and reused across jobs; google-auth keeps the access token and
+# its expiry, so the token endpoint is only hit when the token runs out.
+_CREDS = None
+_CREDS_LOCK = threading.Lock()
+# Token refreshes go through the pooled session too.
+AUTH_REQ = Request(session=SESSION)
 
 
 def get_conn():
-    return sqlite3.connect(DB, check_same_thread=False)
+    return connect(DB)
 
 
-def run_job(row):
-    job_id, jtype, action, payload, status, result = row[:6]
-    payload = json.loads(payload or "{}")
-    try:
-        if action == "gmail/send":
+def get_token():
+    global _CREDS
+    with _CREDS_LOCK:
+        if _CREDS is None:
             creds_path = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS")
             if not creds_path:
                 raise RuntimeError("No GOOGLE_APPLICATION_CREDENTIALS")
-            creds = service_account.Credentials.from_service_account_file(
-                creds_path, scopes=["https://www.googleapis.com/auth/gmail.send"]
+            _CREDS = service_account.Credentials.from_service_account_file(
+                creds_path, scopes=SCOPES
             )
-            service = build("gmail", "v1", credentials=creds)
+        if not _CREDS.valid:
+            _CREDS.refresh(AUTH_REQ)
+        return _CREDS.token
+
+
+def prewarm():
+    """Load the credentials and a token before the first job needs them."""
+    try:
+        get_token()
+    except Exception:
+        logger.warning(
+            "Credential prewarm failed; retrying on first job", exc_info=True
+        )
+
+
+def run_job(row):
+    job_id, jtype, action, payload = row
+    payload = loads(payload or "{}")
+    try:
+        if action == ACTION:
             message = payload.get("raw")
-            # raw should be base64url encoded message
-            service.users().messages().send(
-                userId="me", body={"raw": message}
-            ).execute()
+            # raw should be base64url encoded message; one pooled REST call
+            # instead of a googleapiclient request over httplib2.
+            r = SESSION.post(
+                SEND_URL,
+                json={"raw": message},
+                headers={"Authorization": f"Bearer {get_token()}"},
+                timeout=TIMEOUT,
+            )
+            if r.status_code >= 400:
+                return {
+                    "status": "error",
+                    "http_status": r.status_code,
+                    "text": response_text(r),
+                }
             return {"status": "done"}
         else:
             return {"status": "unknown action"}
@@ -39,25 +82,7 @@ def run_job(row):
 
 
 if __name__ == "__main__":
-    print("GWorkspace worker starting, DB=", DB)
-    while True:
-        try:
-            conn = get_conn()
-            cur = conn.cursor()
-            cur.execute(
-                "SELECT id,type,action,payload,status,result FROM jobs WHERE status='pending' ORDER BY created_at ASC LIMIT 5"
-            )
-            rows = cur.fetchall()
-            for r in rows:
-                job_id = r[0]
-                print("Processing job", job_id, r[2])
-                res = run_job(r)
-                cur.execute(
-                    "UPDATE jobs SET status=?, result=? WHERE id=?",
-                    (res.get("status", "done"), json.dumps(res), job_id),
-                )
-                conn.commit()
-            conn.close()
-        except Exception as e:
-            print("Worker error", e)
-        time.sleep(POLL)
+    logging.basicConfig(format="%(asctime)s %(name)s %(message)s", level=logging.INFO)
+    logger.info("GWorkspace worker starting, DB=%s", DB)
+    prewarm()
+    poll_forever(DB, (ACTION,), run_job, BATCH, POLL)